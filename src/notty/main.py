@@ -10,12 +10,23 @@ from notty.src.computer_action_selection import (
     computer_chooses_action,
     save_qlearning_agent,
 )
-from notty.src.consts import APP_HEIGHT, APP_NAME, APP_WIDTH
+from notty.src.consts import APP_HEIGHT, APP_NAME, APP_WIDTH, COMPUTER_TICK_MS
 from notty.src.player_selection import get_players
 from notty.src.visual.game import VisualGame
 from notty.src.visual.player import VisualPlayer
 from notty.src.visual.winner_display import WinnerDisplay
 
+# Input the game loop never reacts to, kept out of the queue while it sleeps
+IDLE_IGNORED_EVENTS = (
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONUP,
+    pygame.MOUSEWHEEL,
+    pygame.KEYDOWN,
+    pygame.KEYUP,
+    pygame.TEXTINPUT,
+    pygame.TEXTEDITING,
+)
+
 
 def main() -> None:
     """Start the notty game."""
@@ -80,7 +91,7 @@ def get_screen() -> pygame.Surface:
     return screen
 
 
-def run_event_loop(game: VisualGame) -> str:
+def run_event_loop(game: VisualGame) -> str:  # noqa: C901
     """Run the main event loop.
 
     Args:
@@ -91,18 +102,42 @@ def run_event_loop(game: VisualGame) -> str:
     """
     clock = pygame.time.Clock()
 
+    # Bind module lookups used every frame to locals
+    quit_event = pygame.QUIT
+    click_event = pygame.MOUSEBUTTONDOWN
+    expose_event = pygame.WINDOWEXPOSED
+    handled_events = (quit_event, click_event, expose_event)
+    get_events = pygame.event.get
+    clear_events = pygame.event.clear
+    get_ticks = pygame.time.get_ticks
+    flip = pygame.display.flip
+
+    # Computer decisions run on a slower logic tick than rendering
+    next_computer_tick = get_ticks()
+
     while True:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
+        for event in get_events(handled_events):
+            if event.type == quit_event:
                 return "quit"
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_x, mouse_y = pygame.mouse.get_pos()
+            if event.type == click_event:
+                mouse_x, mouse_y = event.pos
                 game.action_board.handle_click(mouse_x, mouse_y)
                 continue
-
-        computer_chooses_action(game)
-
-        game.draw()
+            if event.type == expose_event:
+                game.dirty = True
+        # Drop unhandled events (e.g. mouse motion) without creating Python objects
+        clear_events(pump=False)
+
+        now = get_ticks()
+        if now >= next_computer_tick:
+            computer_chooses_action(game)
+            next_computer_tick = now + COMPUTER_TICK_MS
+
+        # Only redraw when the state changed or cards are still moving
+        redraw = game.dirty or game.is_animating()
+        if redraw:
+            game.draw()
+            game.dirty = False
 
         # Check for winner
         if game.check_win_condition():
@@ -114,8 +149,35 @@ def run_event_loop(game: VisualGame) -> str:
             return show_winner(game)
 
         # Update display
-        pygame.display.flip()
-        clock.tick(60)  # 60 FPS
+        if redraw:
+            flip()
+
+        if game.get_current_player().is_human and not game.is_animating():
+            # Nothing changes until the human acts, so sleep until input arrives
+            wait_for_input()
+        else:
+            clock.tick(60)  # 60 FPS
+
+
+def wait_for_input() -> None:
+    """Sleep until an event the game loop handles arrives.
+
+    Input the loop ignores is blocked while waiting, so e.g. mouse motion is
+    dropped before it reaches the queue instead of waking the loop. The event
+    that ends the wait is posted back for the loop to handle.
+    """
+    newly_blocked = [
+        event_type
+        for event_type in IDLE_IGNORED_EVENTS
+        if not pygame.event.get_blocked(event_type)
+    ]
+    pygame.event.set_blocked(newly_blocked)
+    try:
+        event = pygame.event.wait()
+    finally:
+        # Dialogs opened from the loop need these events again
+        pygame.event.set_allowed(newly_blocked)
+    pygame.event.post(event)
 
 
 def show_winner(game: VisualGame) -> str:
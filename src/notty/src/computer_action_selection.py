@@ -1,7 +1,10 @@
 """Computer action selection."""
 
-from collections import Counter
-from typing import TYPE_CHECKING
+import itertools
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from functools import cache
+from typing import TYPE_CHECKING, TypedDict
 
 from notty.src.consts import MAX_HAND_SIZE
 from notty.src.qlearning_agent import QLearningAgent
@@ -13,8 +16,32 @@ if TYPE_CHECKING:
     from notty.src.visual.game import VisualGame
     from notty.src.visual.player import VisualPlayer
 
-# Q-Learning agent container (persists across games)
-_qlearning_agent_container: dict[str, QLearningAgent | None] = {"agent": None}
+
+class _ActionParams(TypedDict, total=False):
+    """Keyword arguments passed to VisualGame.do_action for an action."""
+
+    count: int
+    card: "VisualCard"
+    cards: list["VisualCard"]
+    target_player: "VisualPlayer"
+
+
+# Q-Learning agent (persists across games)
+_qlearning_agent: QLearningAgent | None = None
+
+# Auto-save the Q-table after this many computer actions
+_AUTO_SAVE_INTERVAL = 100
+_actions_since_save = 0
+
+
+@cache
+def _get_qlearning_save_path() -> str:
+    """Get the Q-table save path, resolved once per process.
+
+    Returns:
+        The Q-table save path as a string.
+    """
+    return str(get_qlearning_save_path())
 
 
 def get_qlearning_agent() -> QLearningAgent:
@@ -23,7 +50,8 @@ def get_qlearning_agent() -> QLearningAgent:
     Returns:
         The Q-Learning agent instance.
     """
-    agent = _qlearning_agent_container["agent"]
+    global _qlearning_agent  # noqa: PLW0603
+    agent = _qlearning_agent
     if agent is None:
         agent = QLearningAgent(
             alpha=0.1,  # Learning rate
@@ -32,14 +60,17 @@ def get_qlearning_agent() -> QLearningAgent:
             epsilon_decay=0.9995,  # Decay rate
             epsilon_min=0.05,  # Minimum exploration
         )
-        _qlearning_agent_container["agent"] = agent
+        _qlearning_agent = agent
         # Try to load existing Q-table
-        save_path = str(get_qlearning_save_path())
+        save_path = _get_qlearning_save_path()
         agent.load(save_path)
     return agent
 
 
-def choose_draw_count(game: "VisualGame") -> int:  # noqa: C901
+def choose_draw_count(  # noqa: C901
+    game: "VisualGame",
+    current_player: "VisualPlayer",
+) -> int:
     """Choose how many cards to draw (1-3) using strategic analysis.
 
     Strategy:
@@ -50,14 +81,14 @@ def choose_draw_count(game: "VisualGame") -> int:  # noqa: C901
 
     Args:
         game: The game instance.
+        current_player: The player whose turn it is.
 
     Returns:
         Number of cards to draw (1-3).
     """
-    current_player = game.get_current_player()
-    hand_size = current_player.hand.size()
-    deck_size = game.deck.size()
     cards = current_player.hand.cards
+    hand_size = len(cards)
+    deck_size = game.deck.size()
 
     # Base decision: start with 2 cards (balanced approach)
     draw_count = 2
@@ -72,18 +103,21 @@ def choose_draw_count(game: "VisualGame") -> int:  # noqa: C901
         draw_count = 3  # Very few cards, draw more aggressively
 
     # Factor 2: Analyze hand potential for forming groups
-    # Count cards by color and number to see if we're close to groups
-    color_counts = Counter(card.color for card in cards)
-    number_counts = Counter(card.number for card in cards)
+    # Group numbers by color and count numbers in a single pass over the hand
+    color_numbers: defaultdict[str, list[int]] = defaultdict(list)
+    number_counts: Counter[int] = Counter()
+    for card in cards:
+        color_numbers[card.color].append(card.number)
+        number_counts[card.number] += 1
 
     # Check if we're close to forming a sequence (3+ consecutive same color)
     sequence_potential = 0
-    for color in color_counts:
-        color_cards = sorted([c.number for c in cards if c.color == color])
+    for numbers in color_numbers.values():
+        numbers.sort()
         # Check for consecutive numbers
-        for i in range(len(color_cards) - 1):
-            if color_cards[i + 1] - color_cards[i] == 1:
-                sequence_potential += 1
+        sequence_potential += sum(
+            1 for a, b in itertools.pairwise(numbers) if b - a == 1
+        )
 
     # Check if we're close to forming a set (4+ same number different colors)
     set_potential = sum(1 for count in number_counts.values() if count >= 3)  # noqa: PLR2004
@@ -135,16 +169,15 @@ def choose_target_player(game: "VisualGame") -> "VisualPlayer":
     return max(other_players, key=lambda p: p.hand.size())
 
 
-def choose_card_to_discard(game: "VisualGame") -> "VisualCard":
+def choose_card_to_discard(current_player: "VisualPlayer") -> "VisualCard":
     """Choose which card to discard in draw-discard-discard action.
 
     Args:
-        game: The game instance.
+        current_player: The player whose turn it is.
 
     Returns:
         The card to discard.
     """
-    current_player = game.get_current_player()
     cards = current_player.hand.cards
 
     if not cards:
@@ -156,30 +189,22 @@ def choose_card_to_discard(game: "VisualGame") -> "VisualCard":
 
     color_counts = Counter(card.color for card in cards)
     number_counts = Counter(card.number for card in cards)
+    # Count exact (color, number) pairs so neighbours are a lookup, not a scan
+    color_number_counts = Counter((card.color, card.number) for card in cards)
 
-    # Score each card (lower is worse, more likely to discard)
-    card_scores: list[tuple[VisualCard, int]] = []
-    for card in cards:
-        score = 0
+    def score(card: "VisualCard") -> int:
         # Cards with more of the same color are better (can form sequences)
-        score += color_counts[card.color] * 2
         # Cards with more of the same number are better (can form sets)
-        score += number_counts[card.number] * 2
-
-        # Check if card can be part of a sequence
-        for other_card in cards:
-            if (
-                other_card.color == card.color
-                and abs(other_card.number - card.number) == 1
-            ):
-                score += 3
-
-        card_scores.append((card, score))
+        # Cards with same-color neighbours can be part of a sequence
+        return (
+            color_counts[card.color] * 2
+            + number_counts[card.number] * 2
+            + color_number_counts[card.color, card.number - 1] * 3
+            + color_number_counts[card.color, card.number + 1] * 3
+        )
 
-    # Sort by score and pick one of the worst cards
-    card_scores.sort(key=lambda x: x[1])
-    # Pick the worst card
-    return card_scores[0][0]
+    # Pick the worst card (lowest score, first one on ties)
+    return min(cards, key=score)
 
 
 def find_best_discard_group(game: "VisualGame") -> list["VisualCard"] | None:
@@ -195,8 +220,21 @@ def find_best_discard_group(game: "VisualGame") -> list["VisualCard"] | None:
     if not discardable_groups:
         return None
     # Prefer larger groups (discard more cards)
-    discardable_groups.sort(key=len, reverse=True)
-    return discardable_groups[0]
+    return max(discardable_groups, key=len)
+
+
+# Parameter choosers for actions that need them, keyed by action
+_ACTION_PARAMS: dict[str, Callable[["VisualGame", "VisualPlayer"], _ActionParams]] = {
+    Action.DRAW_MULTIPLE: lambda game, player: {
+        "count": choose_draw_count(game, player),
+    },
+    Action.STEAL: lambda game, _player: {
+        "target_player": choose_target_player(game),
+    },
+    Action.DRAW_DISCARD_DISCARD: lambda _game, player: {
+        "card": choose_card_to_discard(player),
+    },
+}
 
 
 def computer_chooses_action(game: "VisualGame") -> None:
@@ -205,9 +243,13 @@ def computer_chooses_action(game: "VisualGame") -> None:
     Args:
         game: The game instance.
     """
-    # Check if current player is a computer player and auto-pass
-    current_player = game.get_current_player()
-    if current_player.is_human or not game.can_computer_act():
+    # Bail out early while the computer action delay is still running
+    if not game.can_computer_act():
+        return
+    # Check if current player is a computer player
+    player_index = game.current_player_index
+    current_player = game.players[player_index]
+    if current_player.is_human:
         return
     game.mark_computer_action()
 
@@ -221,31 +263,22 @@ def computer_chooses_action(game: "VisualGame") -> None:
     action = agent.choose_action(game)
 
     # Choose appropriate parameters based on the action
-    count, card, cards, target_player = None, None, None, None
-
-    if action == Action.DRAW_MULTIPLE:
-        count = choose_draw_count(game)
-    elif action == Action.STEAL:
-        target_player = choose_target_player(game)
-    elif action == Action.DRAW_DISCARD_DISCARD:
-        card = choose_card_to_discard(game)
+    params: _ActionParams = {}
+    choose_params = _ACTION_PARAMS.get(action)
+    if choose_params is not None:
+        params = choose_params(game, current_player)
     elif action == Action.DISCARD_GROUP:
         cards = find_best_discard_group(game)
         if cards is None:
             # Fallback: if we can't find a valid group, pass instead
             action = Action.NEXT_TURN
+        else:
+            params = {"cards": cards}
 
     # Execute the action
-    game.do_action(
-        action,
-        count=count,
-        card=card,
-        cards=cards,
-        target_player=target_player,
-    )
+    game.do_action(action, **params)
 
     # Calculate reward based on the action taken
-    player_index = game.players.index(current_player)
     reward = game.calculate_reward(player_index, action)
 
     # Additional reward shaping based on hand size change
@@ -258,20 +291,23 @@ def computer_chooses_action(game: "VisualGame") -> None:
     # Learn from the action
     agent.learn(game, reward)
 
-    # Auto-save Q-table periodically (every 100 actions)
-    if agent.total_actions % 100 == 0:
-        save_path = str(get_qlearning_save_path())
-        agent.save(save_path)
+    # Auto-save Q-table periodically (every 100 actions) without stalling a frame
+    global _actions_since_save  # noqa: PLW0603
+    _actions_since_save += 1
+    if _actions_since_save >= _AUTO_SAVE_INTERVAL:
+        _actions_since_save = 0
+        save_path = _get_qlearning_save_path()
+        agent.save_in_background(save_path)
 
 
 def save_qlearning_agent() -> None:
     """Save the Q-Learning agent's Q-table."""
-    if _qlearning_agent_container["agent"] is not None:
-        save_path = str(get_qlearning_save_path())
-        _qlearning_agent_container["agent"].save(save_path)
+    if _qlearning_agent is not None:
+        save_path = _get_qlearning_save_path()
+        _qlearning_agent.save(save_path)
 
 
 def reset_qlearning_episode() -> None:
     """Reset the Q-Learning agent for a new episode/game."""
-    if _qlearning_agent_container["agent"] is not None:
-        _qlearning_agent_container["agent"].reset_episode()
+    if _qlearning_agent is not None:
+        _qlearning_agent.reset_episode()
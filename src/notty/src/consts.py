@@ -7,6 +7,9 @@ APP_NAME = notty.__name__
 
 ANIMATION_SPEED = 15
 
+# milliseconds between checks whether a computer player should act
+COMPUTER_TICK_MS = 100
+
 MAX_HAND_SIZE = 20
 MAX_PLAYERS = 3
 MIN_PLAYERS = 2
@@ -1,17 +1,31 @@
 """Q-Learning agent for Notty card game."""
 
+import json
 import logging
 import pickle  # nosec: B403
-import secrets
-from collections import defaultdict
+import random
+import tempfile
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
+
+from notty.src.visual.action_board import Action
 
 if TYPE_CHECKING:
     from notty.src.visual.game import VisualGame
 
 logger = logging.getLogger(__name__)
 
+# Every pickle protocol since 2 starts with the PROTO opcode
+_PICKLE_MAGIC = b"\x80"
+
+# Fixed column order of the Q-table
+ACTIONS = tuple(sorted(Action.ALL))
+ACTION_INDEX = {action: index for index, action in enumerate(ACTIONS)}
+
+# hand bucket (4) x deck bucket (3) x can discard (2) x other hand bucket (4)
+NUM_STATES = 4 * 3 * 2 * 4
+
 
 class QLearningAgent:
     """Q-Learning agent that learns to play Notty through reinforcement learning."""
@@ -33,29 +47,32 @@ class QLearningAgent:
             epsilon_decay: Rate at which epsilon decreases.
             epsilon_min: Minimum epsilon value.
         """
-        self.q_table: dict[tuple[int, int, bool, int], dict[str, float]] = defaultdict(
-            lambda: defaultdict(float),
-        )
+        # One row per state, one column per action in ACTIONS order
+        self.q_table = [[0.0] * len(ACTIONS) for _ in range(NUM_STATES)]
         self.alpha = alpha
         self.gamma = gamma
         self.epsilon = epsilon
         self.epsilon_decay = epsilon_decay
         self.epsilon_min = epsilon_min
+        # Action sampling needs no cryptographic randomness, so use a fast PRNG
+        self._rng = random.Random()  # noqa: S311  # nosec: B311
 
         # Track learning statistics
         self.total_actions = 0
         self.exploration_actions = 0
-        self.last_state: tuple[int, int, bool, int] | None = None
+        self.last_state: int | None = None
         self.last_action: str | None = None
+        # Thread of the last background save, joined before the next write
+        self._save_thread: threading.Thread | None = None
 
-    def get_state(self, game: "VisualGame") -> tuple[int, int, bool, int]:
+    def get_state(self, game: "VisualGame") -> int:
         """Extract state features from the game.
 
         Args:
             game: The game instance.
 
         Returns:
-            Tuple representing the current state.
+            Index of the current state in the Q-table.
         """
         current_player = game.get_current_player()
         hand_size = current_player.hand.size()
@@ -79,7 +96,35 @@ class QLearningAgent:
         )
         other_hand_bucket = min(avg_other_hand_size // 5, 3)
 
-        return (hand_bucket, deck_bucket, can_discard, other_hand_bucket)
+        return self._state_index(
+            hand_bucket,
+            deck_bucket,
+            can_discard=can_discard,
+            other_hand_bucket=other_hand_bucket,
+        )
+
+    @staticmethod
+    def _state_index(
+        hand_bucket: int,
+        deck_bucket: int,
+        *,
+        can_discard: bool,
+        other_hand_bucket: int,
+    ) -> int:
+        """Encode state features as a row index of the Q-table.
+
+        Args:
+            hand_bucket: Bucket of the current player's hand size (0-3).
+            deck_bucket: Bucket of the deck size (0-2).
+            can_discard: Whether the current player can discard a group.
+            other_hand_bucket: Bucket of the other players' hand size (0-3).
+
+        Returns:
+            The row index of the state.
+        """
+        return ((hand_bucket * 3 + deck_bucket) * 2 + can_discard) * 4 + (
+            other_hand_bucket
+        )
 
     def choose_action(self, game: "VisualGame") -> str:
         """Choose an action using epsilon-greedy policy.
@@ -100,18 +145,19 @@ class QLearningAgent:
         self.total_actions += 1
 
         # Epsilon-greedy exploration
-        if secrets.randbelow(10000) / 10000 < self.epsilon:
+        if self._rng.random() < self.epsilon:
             self.exploration_actions += 1
-            action = secrets.choice(possible_actions)
+            action = self._rng.choice(possible_actions)
         else:
             # Exploitation: choose best known action
-            q_values = {
-                action: self.q_table[state][action] for action in possible_actions
-            }
-            max_q = max(q_values.values())
+            row = self.q_table[state]
+            q_values = [row[ACTION_INDEX[action]] for action in possible_actions]
+            max_q = max(q_values)
             # If multiple actions have same Q-value, choose randomly among them
-            best_actions = [a for a, q in q_values.items() if q == max_q]
-            action = secrets.choice(best_actions)
+            best_actions = [
+                a for a, q in zip(possible_actions, q_values, strict=True) if q == max_q
+            ]
+            action = self._rng.choice(best_actions)
 
         # Store for learning
         self.last_state = state
@@ -134,16 +180,17 @@ class QLearningAgent:
 
         # Get max Q-value for next state
         if possible_actions:
-            next_max_q = max(
-                self.q_table[current_state][action] for action in possible_actions
-            )
+            row = self.q_table[current_state]
+            next_max_q = max(row[ACTION_INDEX[action]] for action in possible_actions)
         else:
             next_max_q = 0.0
 
         # Q-learning update rule
-        old_q = self.q_table[self.last_state][self.last_action]
+        last_row = self.q_table[self.last_state]
+        action_index = ACTION_INDEX[self.last_action]
+        old_q = last_row[action_index]
         new_q = old_q + self.alpha * (reward + self.gamma * next_max_q - old_q)
-        self.q_table[self.last_state][self.last_action] = new_q
+        last_row[action_index] = new_q
 
         # Decay epsilon
         self.epsilon = max(self.epsilon_min, self.epsilon * self.epsilon_decay)
@@ -153,27 +200,81 @@ class QLearningAgent:
         self.last_state = None
         self.last_action = None
 
-    def save(self, filepath: str = "notty_qtable.pkl") -> None:
+    def save(self, filepath: str = "notty_qtable.json") -> None:
         """Save Q-table to file.
 
         Args:
             filepath: Path to save the Q-table.
         """
-        data: dict[
-            str,
-            dict[tuple[int, int, bool, int], dict[str, float]] | float | int,
-        ] = {
-            "q_table": dict(self.q_table),
+        # A pending background save must not replace this newer snapshot
+        self._join_background_save()
+        self._write(filepath, self._serialize())
+
+    def save_in_background(self, filepath: str = "notty_qtable.json") -> None:
+        """Save Q-table to file without blocking on disk I/O.
+
+        The Q-table is serialized right away so later updates cannot race with
+        the save, and the file is written on a daemon thread. Saves are
+        written in the order they were started.
+
+        Args:
+            filepath: Path to save the Q-table.
+        """
+        data = self._serialize()
+        self._join_background_save()
+        self._save_thread = threading.Thread(
+            target=self._write,
+            args=(filepath, data),
+            daemon=True,
+        )
+        self._save_thread.start()
+
+    def _join_background_save(self) -> None:
+        """Wait until the last background save has been written."""
+        if self._save_thread is not None:
+            self._save_thread.join()
+            self._save_thread = None
+
+    def _serialize(self) -> bytes:
+        """Serialize the Q-table and learning statistics.
+
+        Returns:
+            The agent data encoded as JSON.
+        """
+        data: dict[str, dict[str, list[float]] | float | int] = {
+            # Columns are keyed by action so the file survives action changes
+            "q_table": {
+                action: [row[index] for row in self.q_table]
+                for action, index in ACTION_INDEX.items()
+            },
             "epsilon": self.epsilon,
             "total_actions": self.total_actions,
             "exploration_actions": self.exploration_actions,
         }
-        Path(filepath).parent.mkdir(parents=True, exist_ok=True)
-        with Path(filepath).open("wb") as f:
-            pickle.dump(data, f)
+        return json.dumps(data).encode()
+
+    @staticmethod
+    def _write(filepath: str, data: bytes) -> None:
+        """Write serialized agent data to file atomically.
+
+        Args:
+            filepath: Path to save the Q-table.
+            data: The serialized agent data.
+        """
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so a crash never leaves a partial file
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent,
+            prefix=path.name,
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            f.write(data)
+        Path(f.name).replace(path)
         logger.info("Q-table saved to %s", filepath)
 
-    def load(self, filepath: str = "notty_qtable.pkl") -> bool:
+    def load(self, filepath: str = "notty_qtable.json") -> bool:
         """Load Q-table from file.
 
         Args:
@@ -182,26 +283,30 @@ class QLearningAgent:
         Returns:
             True if loaded successfully, False otherwise.
         """
-        if not Path(filepath).exists():
+        path = Path(filepath)
+        legacy_path = path.with_suffix(".pkl")
+        if not path.exists() and legacy_path.exists():
+            # Migrate a Q-table pickled by older versions, the next save writes JSON
+            path = legacy_path
+        if not path.exists():
             logger.info("No Q-table found at %s, starting fresh", filepath)
             return False
 
         try:
-            with Path(filepath).open("rb") as f:
-                data = pickle.load(f)  # nosec: B301  # noqa: S301
+            raw = path.read_bytes()
+            if raw.startswith(_PICKLE_MAGIC):
+                data = pickle.loads(raw)  # nosec: B301  # noqa: S301
+            else:
+                data = json.loads(raw)
 
-            # Convert back to defaultdict
-            self.q_table = defaultdict(lambda: defaultdict(float))
-            for state, actions in data["q_table"].items():
-                for action, q_value in actions.items():
-                    self.q_table[state][action] = q_value
+            self.q_table = self._load_q_table(data["q_table"])
 
             self.epsilon = data.get("epsilon", self.epsilon)
             self.total_actions = data.get("total_actions", 0)
             self.exploration_actions = data.get("exploration_actions", 0)
 
-            logger.info("Q-table loaded from %s", filepath)
-            logger.info("  States learned: %d", len(self.q_table))
+            logger.info("Q-table loaded from %s", path)
+            logger.info("  States learned: %d", self._count_states_learned())
             logger.info("  Total actions: %d", self.total_actions)
             logger.info("  Exploration rate: %.3f", self.epsilon)
         except Exception:
@@ -222,9 +327,50 @@ class QLearningAgent:
             else 0
         )
         return {
-            "states_learned": len(self.q_table),
+            "states_learned": self._count_states_learned(),
             "total_actions": self.total_actions,
             "exploration_actions": self.exploration_actions,
             "exploration_rate": exploration_rate,
             "current_epsilon": self.epsilon,
         }
+
+    def _count_states_learned(self) -> int:
+        """Count the states that have at least one learned Q-value.
+
+        Returns:
+            Number of states with a non-zero Q-value.
+        """
+        return sum(1 for row in self.q_table if any(row))
+
+    @classmethod
+    def _load_q_table(cls, saved: dict[Any, Any]) -> list[list[float]]:
+        """Build a Q-table from saved data.
+
+        Args:
+            saved: Q-values per action column, or the older mapping of state
+                feature tuples to Q-values per action.
+
+        Returns:
+            The Q-table with one row per state.
+        """
+        q_table = [[0.0] * len(ACTIONS) for _ in range(NUM_STATES)]
+        for key, values in saved.items():
+            if isinstance(key, tuple):
+                # Older files keyed Q-values by state feature tuples
+                hand_bucket, deck_bucket, can_discard, other_hand_bucket = key
+                row = q_table[
+                    cls._state_index(
+                        hand_bucket,
+                        deck_bucket,
+                        can_discard=can_discard,
+                        other_hand_bucket=other_hand_bucket,
+                    )
+                ]
+                for action, q_value in values.items():
+                    if action in ACTION_INDEX:
+                        row[ACTION_INDEX[action]] = q_value
+            elif key in ACTION_INDEX:
+                column = ACTION_INDEX[key]
+                for row, q_value in zip(q_table, values, strict=False):
+                    row[column] = q_value
+        return q_table
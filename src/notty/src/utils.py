@@ -1,5 +1,6 @@
 """utils."""
 
+from functools import cache
 from pathlib import Path
 
 import pygame
@@ -35,10 +36,12 @@ def get_window_size() -> tuple[int, int]:
     return app_width, app_height
 
 
+@cache
 def get_user_data_dir() -> Path:
     """Get the user data directory for saving game data.
 
     This works correctly both in development and when packaged with PyInstaller.
+    The directory is resolved and created once per process.
 
     Returns:
         Path to the user data directory.
@@ -49,10 +52,11 @@ def get_user_data_dir() -> Path:
     return data_dir
 
 
+@cache
 def get_qlearning_save_path() -> Path:
     """Get the path for saving Q-Learning agent data.
 
     Returns:
         Path to the Q-table save file.
     """
-    return get_user_data_dir() / "notty_qtable.pkl"
+    return get_user_data_dir() / "notty_qtable.json"
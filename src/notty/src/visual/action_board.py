@@ -1,6 +1,6 @@
 """Action board for displaying available actions to the human player."""
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 import pygame
 
@@ -11,6 +11,7 @@ from notty.src.consts import (
     ACTION_BOARD_Y,
     ANTI_ALIASING,
 )
+from notty.src.visual.base import Blit, get_border_surface, get_font
 
 if TYPE_CHECKING:
     from notty.src.visual.game import VisualGame
@@ -27,17 +28,19 @@ class Action:
     NEXT_TURN = "next_turn"
     PLAY_FOR_ME = "play_for_me"
 
+    ALL: ClassVar[tuple[str, ...]] = (
+        DRAW_MULTIPLE,
+        STEAL,
+        DRAW_DISCARD_DRAW,
+        DRAW_DISCARD_DISCARD,
+        DISCARD_GROUP,
+        NEXT_TURN,
+    )
+
     @classmethod
-    def get_all_actions(cls) -> set[str]:
+    def get_all_actions(cls) -> tuple[str, ...]:
         """Get all actions."""
-        return {
-            cls.DRAW_MULTIPLE,
-            cls.STEAL,
-            cls.DRAW_DISCARD_DRAW,
-            cls.DRAW_DISCARD_DISCARD,
-            cls.DISCARD_GROUP,
-            cls.NEXT_TURN,
-        }
+        return cls.ALL
 
 
 class ActionButton:
@@ -73,6 +76,7 @@ class ActionButton:
         self.action_name = action_name
         self.enabled = enabled
         self.hovered = False
+        self.rect = pygame.Rect(x, y, width, height)
 
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """Check if the button was clicked.
@@ -86,10 +90,7 @@ class ActionButton:
         """
         if not self.enabled:
             return False
-        return (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        return self.rect.collidepoint(mouse_x, mouse_y)
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state based on mouse position.
@@ -98,10 +99,7 @@ class ActionButton:
             mouse_x: Mouse x coordinate.
             mouse_y: Mouse y coordinate.
         """
-        self.hovered = (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        self.hovered = self.rect.collidepoint(mouse_x, mouse_y)
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the button.
@@ -109,6 +107,14 @@ class ActionButton:
         Args:
             screen: The pygame display surface.
         """
+        screen.blit(self.render(), (self.x, self.y))
+
+    def render(self) -> pygame.Surface:
+        """Render the button in its current state.
+
+        Returns:
+            The button surface, faded out when disabled.
+        """
         # Determine button color based on state
         if not self.enabled:
             bg_color = (100, 100, 100)  # Gray for disabled
@@ -142,14 +148,14 @@ class ActionButton:
 
         # Draw button text on the surface - scale font size based on button height
         font_size = int(self.height * 0.5)  # 70% of button height (doubled from 35%)
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
         text_surface = font.render(self.text, ANTI_ALIASING, text_color)
         text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 2))
         button_surface.blit(text_surface, text_rect)
 
-        # Set alpha and blit to screen
+        # Set alpha so the surface can be blitted to the screen
         button_surface.set_alpha(alpha)
-        screen.blit(button_surface, (self.x, self.y))
+        return button_surface
 
 
 class ActionBoard:
@@ -173,6 +179,8 @@ class ActionBoard:
         self.game = game
         self.buttons: list[ActionButton] = []
         self._setup_buttons()
+        # The panel around the buttons never changes, so render it once
+        self.panel_blits = self._render_panel()
 
     def _setup_buttons(self) -> None:
         """Set up the action buttons."""
@@ -221,6 +229,8 @@ class ActionBoard:
                 enabled=False,  # Will be updated based on game state
             )
             self.buttons.append(button)
+        # Hit-test all buttons with one collidelist call
+        self.button_rects = [button.rect for button in self.buttons]
 
     def update_button_states(self, game: "VisualGame") -> None:
         """Update button enabled states based on current game state.
@@ -247,8 +257,9 @@ class ActionBoard:
             mouse_x: Mouse x coordinate.
             mouse_y: Mouse y coordinate.
         """
-        for button in self.buttons:
-            button.update_hover(mouse_x, mouse_y)
+        index = pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self.button_rects)
+        for i, button in enumerate(self.buttons):
+            button.hovered = i == index
 
     def handle_click(self, mouse_x: int, mouse_y: int) -> None:
         """Handle click on action board.
@@ -260,13 +271,9 @@ class ActionBoard:
         Returns:
             The action name if a button was clicked, None otherwise.
         """
-        game = self.game
-        for button in self.buttons:
-            enabled = button.enabled
-            clicked = button.is_clicked(mouse_x, mouse_y)
-            action_name = button.action_name
-            if enabled and clicked:
-                game.do_action(action_name)
+        index = pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self.button_rects)
+        if index != -1 and self.buttons[index].enabled:
+            self.game.do_action(self.buttons[index].action_name)
 
     def draw(self) -> None:
         """Draw the action board and all buttons.
@@ -276,45 +283,71 @@ class ActionBoard:
         # Automatically update button states based on current game state
         self.update_button_states(self.game)
 
-        # Draw background panel
-        panel_padding = 15
-        if self.buttons:
-            first_button = self.buttons[0]
-            last_button = self.buttons[-1]
-
-            panel_x = first_button.x - panel_padding
-            panel_y = first_button.y - panel_padding
-            panel_width = first_button.width + 2 * panel_padding
-            panel_height = (
-                last_button.y + last_button.height - first_button.y + 2 * panel_padding
-            )
+        self.screen.blits(self.collect_blits(), doreturn=False)
 
-            # Draw semi-transparent background
-            panel_surface = pygame.Surface((panel_width, panel_height))
-            panel_surface.set_alpha(200)
-            panel_surface.fill((40, 40, 40))
-            self.screen.blit(panel_surface, (panel_x, panel_y))
-
-            # Draw border
-            pygame.draw.rect(
-                self.screen,
-                (200, 200, 200),
-                (panel_x, panel_y, panel_width, panel_height),
-                3,
-            )
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the panel, title and buttons.
 
-            # Draw title - scale font size
-            font_size = int(ACTION_BOARD_HEIGHT * 0.04)  # 4% of action board height
-            font = pygame.font.Font(None, font_size)
-            title_text = font.render("Actions", ANTI_ALIASING, (255, 255, 255))
-            title_rect = title_text.get_rect(
-                center=(
-                    panel_x + panel_width // 2,
-                    panel_y - int(ACTION_BOARD_HEIGHT * 0.025),
-                ),
-            )
-            self.screen.blit(title_text, title_rect)
+        Returns:
+            The surfaces to blit with their positions, in drawing order.
+        """
+        blits = self.panel_blits.copy()
 
         # Draw all buttons
-        for button in self.buttons:
-            button.draw(self.screen)
+        blits.extend((button.render(), (button.x, button.y)) for button in self.buttons)
+        return blits
+
+    def _render_panel(self) -> list[Blit]:
+        """Render the background panel, its border and the title.
+
+        Returns:
+            The blits that draw the panel, in drawing order.
+        """
+        if not self.buttons:
+            return []
+        panel_rect = self._get_panel_rect()
+
+        # Draw semi-transparent background
+        panel_surface = pygame.Surface(panel_rect.size)
+        panel_surface.set_alpha(200)
+        panel_surface.fill((40, 40, 40))
+
+        # Draw border
+        border_surface = get_border_surface(
+            panel_rect.width,
+            panel_rect.height,
+            (200, 200, 200),
+            3,
+        )
+
+        # Draw title - scale font size
+        font_size = int(ACTION_BOARD_HEIGHT * 0.04)  # 4% of action board height
+        font = get_font(font_size)
+        title_text = font.render("Actions", ANTI_ALIASING, (255, 255, 255))
+        title_rect = title_text.get_rect(
+            center=(
+                panel_rect.centerx,
+                panel_rect.y - int(ACTION_BOARD_HEIGHT * 0.025),
+            ),
+        )
+        return [
+            (panel_surface, panel_rect.topleft),
+            (border_surface, panel_rect.topleft),
+            (title_text, title_rect.topleft),
+        ]
+
+    def _get_panel_rect(self) -> pygame.Rect:
+        """Get the background panel area around all buttons.
+
+        Returns:
+            The panel rect.
+        """
+        panel_padding = 15
+        first_button = self.buttons[0]
+        last_button = self.buttons[-1]
+        return pygame.Rect(
+            first_button.x - panel_padding,
+            first_button.y - panel_padding,
+            first_button.width + 2 * panel_padding,
+            last_button.y + last_button.height - first_button.y + 2 * panel_padding,
+        )
@@ -1,6 +1,8 @@
 """Contains a base clöass Visual to represent a visual element."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from functools import cache
 from pathlib import Path
 from types import ModuleType
 
@@ -9,10 +11,75 @@ from pyrig.core.resources import resource_path
 
 from notty.src.consts import ANIMATION_SPEED
 
+# A surface and the position to blit it at, as accepted by Surface.blits
+type Blit = tuple[pygame.Surface, tuple[float, float]]
+
+
+@cache
+def get_font(size: int) -> pygame.font.Font:
+    """Get the default font at a size, loading each size only once.
+
+    Args:
+        size: Font size in pixels.
+
+    Returns:
+        The font.
+    """
+    return pygame.font.Font(None, size)
+
+
+def cull_blits(surface: pygame.Surface, blits: Iterable[Blit]) -> list[Blit]:
+    """Drop the blits that would land entirely outside a surface's clip area.
+
+    Fully clipped blits draw nothing but still pay the setup cost of a blit,
+    e.g. when a dialog hangs off the edge of a small window.
+
+    Args:
+        surface: The surface the blits are drawn onto.
+        blits: The blits to filter.
+
+    Returns:
+        The blits that touch the clip area.
+    """
+    clip = surface.get_clip()
+    return [blit for blit in blits if clip.colliderect(blit[1], blit[0].get_size())]
+
+
+@cache
+def get_border_surface(
+    width: int,
+    height: int,
+    color: tuple[int, int, int],
+    border_width: int,
+) -> pygame.Surface:
+    """Get a pre-rendered rectangle border.
+
+    Everything inside the border is transparent, so blitting the surface
+    draws the same pixels as pygame.draw.rect with the given border width.
+
+    Args:
+        width: Width of the border rectangle.
+        height: Height of the border rectangle.
+        color: Color of the border.
+        border_width: Thickness of the border.
+
+    Returns:
+        The border surface.
+    """
+    colorkey = (0, 255, 0) if color == (255, 0, 255) else (255, 0, 255)
+    surface = pygame.Surface((width, height))
+    surface.fill(colorkey)
+    pygame.draw.rect(surface, color, surface.get_rect(), border_width)
+    surface.set_colorkey(colorkey, pygame.RLEACCEL)
+    return surface
+
 
 class Visual(ABC):
     """Base class for all visual elements."""
 
+    # Slots let many small elements like cards skip the instance __dict__
+    __slots__ = ("height", "png", "screen", "target_x", "target_y", "width", "x", "y")
+
     def __init__(
         self,
         x: int,
@@ -38,8 +105,7 @@ class Visual(ABC):
         self.width = width
         self.screen = screen
 
-        png = pygame.image.load(self.get_png_path())
-        self.png = pygame.transform.scale(png, (self.width, self.height))
+        self.png = self.load_png()
 
     def get_center(self) -> tuple[int, int]:
         """Get the center of the visual element."""
@@ -67,8 +133,20 @@ class Visual(ABC):
         self.x = x
         self.y = y
 
+    def is_moving(self) -> bool:
+        """Check if the visual element is still moving toward its target."""
+        return self.x != self.target_x or self.y != self.target_y
+
     def draw(self) -> None:
         """Draw the visual element."""
+        self.screen.blits(self.collect_blits(), doreturn=False)
+
+    def collect_blits(self) -> list[Blit]:
+        """Advance the animation and collect the blits that draw the element.
+
+        Returns:
+            The surfaces to blit with their positions, in drawing order.
+        """
         # Smoothly move toward target
         dx = self.target_x - self.x
         dy = self.target_y - self.y
@@ -84,7 +162,21 @@ class Visual(ABC):
             self.y = self.target_y
 
         # Draw the image at current position
-        self.screen.blit(self.png, (self.x, self.y))
+        return [(self.png, (self.x, self.y))]
+
+    def load_png(self) -> pygame.Surface:
+        """Load the image of the visual element scaled to its size.
+
+        Returns:
+            The scaled image, in display format once a window exists.
+        """
+        png = pygame.image.load(self.get_png_path())
+        png = pygame.transform.scale(png, (self.width, self.height))
+        # Display format lets every per-frame blit skip pixel conversion,
+        # but converting needs a window, so headless loads keep the png format
+        if pygame.display.get_surface() is None:
+            return png
+        return png.convert_alpha()
 
     def get_png_path(self) -> Path:
         """Get the png for the visual element."""
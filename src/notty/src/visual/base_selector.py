@@ -1,15 +1,59 @@
 """Base selector dialog for choosing items with images."""
 
 from abc import ABC, abstractmethod
-from collections.abc import Callable
-from typing import TypeVar
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import ClassVar, TypeVar
 
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.visual.base import Blit, cull_blits, get_font
 
 T = TypeVar("T")
 
+# Events after which the whole window has to be presented again
+EXPOSE_EVENTS = frozenset({pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE})
+
+
+def get_grid_positions(
+    num_items: int,
+    item_size: tuple[int, int],
+    spacing: int,
+    *,
+    start_y: int,
+    max_per_row: int | None = None,
+) -> list[tuple[int, int]]:
+    """Lay out items in horizontally centered rows.
+
+    The offset of each row is computed once and its x coordinates come from
+    a range, instead of redoing the row arithmetic for every item.
+
+    Args:
+        num_items: Number of items to place.
+        item_size: Width and height of each item.
+        spacing: Gap between neighbouring items and rows.
+        start_y: Y coordinate of the first row.
+        max_per_row: Maximum number of items per row, all in one row if None.
+
+    Returns:
+        The top-left corner of each item, row by row.
+    """
+    item_width, item_height = item_size
+    per_row = max_per_row or max(num_items, 1)
+    step_x = item_width + spacing
+    step_y = item_height + spacing
+    positions: list[tuple[int, int]] = []
+    for row, first in enumerate(range(0, num_items, per_row)):
+        in_row = min(per_row, num_items - first)
+        row_width = in_row * item_width + (in_row - 1) * spacing
+        start_x = int((APP_WIDTH - row_width) // 2)
+        y = start_y + row * step_y
+        positions.extend(
+            (x, y) for x in range(start_x, start_x + in_row * step_x, step_x)
+        )
+    return positions
+
 
 class SelectableButton[T](ABC):
     """Base class for selectable buttons with images."""
@@ -48,6 +92,7 @@ class SelectableButton[T](ABC):
         self.selectable = selectable
         self.hovered = False
         self.selected = False
+        self.rect = pygame.Rect(x, y, width, height)
 
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """Check if the button was clicked.
@@ -61,10 +106,7 @@ class SelectableButton[T](ABC):
         """
         if not self.enabled:
             return False
-        return (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        return self.rect.collidepoint(mouse_x, mouse_y)
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state based on mouse position.
@@ -73,13 +115,15 @@ class SelectableButton[T](ABC):
             mouse_x: Mouse x coordinate.
             mouse_y: Mouse y coordinate.
         """
-        if not self.enabled:
-            self.hovered = False
-            return
-        self.hovered = (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        self.hovered = self.enabled and self.rect.collidepoint(mouse_x, mouse_y)
+
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area the button draws into.
+
+        Returns:
+            The bounding rect of the button.
+        """
+        return self.rect.copy()
 
     def toggle_selection(
         self,
@@ -100,18 +144,36 @@ class SelectableButton[T](ABC):
                 # Only allow selection if under max
                 self.selected = True
 
-    @abstractmethod
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the button.
 
         Args:
             screen: The pygame display surface.
         """
+        screen.blits(self.collect_blits(), doreturn=False)
+
+    @abstractmethod
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the button in its current state.
+
+        Returns:
+            The surfaces to blit with their positions, in drawing order.
+        """
 
 
 class BaseSelector[T](ABC):
     """Base class for selector dialogs."""
 
+    # Input the dialog never reacts to, kept out of the queue while it is shown
+    IGNORED_EVENTS: ClassVar[tuple[int, ...]] = (
+        pygame.KEYDOWN,
+        pygame.KEYUP,
+        pygame.MOUSEBUTTONUP,
+        pygame.MOUSEWHEEL,
+        pygame.TEXTINPUT,
+        pygame.TEXTEDITING,
+    )
+
     def __init__(
         self,
         screen: pygame.Surface,
@@ -137,12 +199,45 @@ class BaseSelector[T](ABC):
         self.max_selections = max_selections
         self.validation_func = validation_func
         self.buttons: list[SelectableButton[T]] = []
+        self.hovered_button: SelectableButton[T] | None = None
+        self.background: pygame.Surface | None = None
+        # Whether the whole window has been presented since it was exposed
+        self.presented = False
         self._setup_buttons()
+        # Only enabled buttons take part in hit-testing
+        self.hit_buttons = [button for button in self.buttons if button.enabled]
+        self.hit_rects = [button.rect for button in self.hit_buttons]
+
+        # Semi-transparent overlay and dialog area are the same every frame
+        self.overlay = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT))).convert()
+        self.overlay.set_alpha(200)
+        self.overlay.fill((0, 0, 0))
+        dialog_width, dialog_height = self._get_dialog_dimensions()
+        self.dialog_rect = pygame.Rect(
+            int((APP_WIDTH - dialog_width) // 2),
+            int((APP_HEIGHT - dialog_height) // 2),
+            dialog_width,
+            dialog_height,
+        )
+        self._render_static_text()
 
     @abstractmethod
     def _setup_buttons(self) -> None:
         """Set up the selectable buttons. Must be implemented by subclasses."""
 
+    def _render_static_text(self) -> None:
+        """Render the text that stays the same on every frame."""
+        font_size = int(APP_HEIGHT * 0.06)  # 6% of screen height
+        font = get_font(font_size)
+        self.title_text = font.render(
+            self.title,
+            ANTI_ALIASING,
+            (255, 255, 255),
+        ).convert_alpha()
+        self.title_rect = self.title_text.get_rect(
+            center=(int(APP_WIDTH // 2), self.dialog_rect.y + int(APP_HEIGHT * 0.06)),
+        )
+
     @abstractmethod
     def _get_button_dimensions(self) -> tuple[int, int, int]:
         """Get button dimensions (width, height, spacing).
@@ -189,76 +284,191 @@ class BaseSelector[T](ABC):
             Returns None if no selection was made.
         """
         clock = pygame.time.Clock()
-
-        while True:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    raise SystemExit
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-
-                    # Check if any button was clicked
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_x, mouse_y):
+        self._render_background()
+        self._update_hover(*pygame.mouse.get_pos())
+        # Show the dialog before blocking on the first event
+        self._present(redraw=True, dirty_rects=[])
+        redraw = False
+
+        with self._ignoring_unused_events():
+            while True:
+                # Handle events
+                # Only the last mouse position of a batch matters for hover
+                mouse_pos: tuple[int, int] | None = None
+                for event in self._wait_for_events():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        raise SystemExit
+                    if event.type == pygame.MOUSEMOTION:
+                        mouse_pos = event.pos
+                        continue
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        mouse_x, mouse_y = event.pos
+
+                        # Check if any button was clicked
+                        button = self._get_button_at(mouse_x, mouse_y)
+                        if button is not None:
                             if self.max_selections == 1:
                                 # Single selection - return immediately
                                 return button.item
                             # Multi-selection - toggle selection
                             current_count = len(self._get_selected_items())
                             button.toggle_selection(current_count, self.max_selections)
-                            break
+                            redraw = True
 
-            # Update hover state
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            for button in self.buttons:
-                button.update_hover(mouse_x, mouse_y)
+                dirty_rects = (
+                    [] if mouse_pos is None else self._update_hover(*mouse_pos)
+                )
+                self._present(redraw=redraw, dirty_rects=dirty_rects)
+                redraw = False
+                clock.tick(60)  # 60 FPS
 
-            # Draw
-            self._draw()
+    def _present(self, *, redraw: bool, dirty_rects: list[pygame.Rect]) -> None:
+        """Draw the dialog and push the changed parts to the display.
+
+        Nothing is drawn when the window is up to date, so events that change
+        nothing cost no rendering.
 
-            # Update display
+        Args:
+            redraw: Whether a selection changed the dialog.
+            dirty_rects: Areas whose hover state changed.
+        """
+        if not self.presented:
+            # First frame, or the window was exposed and lost its contents
+            self._draw()
             pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+            self.presented = True
+        elif redraw:
+            self._draw()
+            # Outside this rect the window only shows the static overlay
+            pygame.display.update(self._get_present_rect())
+        elif dirty_rects:
+            # Only hover changed, so present just the affected buttons
+            self._draw()
+            pygame.display.update(dirty_rects)
 
-    def _draw(self) -> None:
-        """Draw the selector dialog."""
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT)))
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+    def _get_present_rect(self) -> pygame.Rect:
+        """Get the area that can change when the dialog is redrawn.
 
-        # Get dialog dimensions
-        dialog_width, dialog_height = self._get_dialog_dimensions()
-        dialog_x = int((APP_WIDTH - dialog_width) // 2)
-        dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        Returns:
+            The dialog rect, grown to cover all buttons.
+        """
+        return self.dialog_rect.unionall([button.get_rect() for button in self.buttons])
+
+    @contextmanager
+    def _ignoring_unused_events(self) -> Iterator[None]:
+        """Block the ignored events while the dialog is shown.
+
+        Blocked events are dropped before they reach the queue, so they
+        neither wake the dialog nor cause a redraw.
+
+        Yields:
+            Nothing, the events are allowed again on exit.
+        """
+        newly_blocked = [
+            event_type
+            for event_type in self.IGNORED_EVENTS
+            if not pygame.event.get_blocked(event_type)
+        ]
+        pygame.event.set_blocked(newly_blocked)
+        try:
+            yield
+        finally:
+            pygame.event.set_allowed(newly_blocked)
+
+    def _wait_for_events(self) -> list[pygame.event.Event]:
+        """Wait for an event and collect everything queued.
+
+        Nothing in the dialog changes without an event, so blocking in the
+        event queue lets the process sleep until there is work to do.
+
+        Returns:
+            The pending events, at least one.
+        """
+        # wait() already pumped the queue, so drain it without pumping again
+        events = [pygame.event.wait()]
+        events.extend(pygame.event.get(pump=False))
+        if any(event.type in EXPOSE_EVENTS for event in events):
+            self.presented = False
+        return events
+
+    def _update_hover(self, mouse_x: int, mouse_y: int) -> list[pygame.Rect]:
+        """Update the hover state of all buttons.
+
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
+
+        Returns:
+            The rects of the buttons whose hover state changed.
+        """
+        button = self._get_button_at(mouse_x, mouse_y)
+        if button is self.hovered_button:
+            return []
+        # Only the previously and newly hovered buttons change
+        dirty_rects = []
+        for changed in (self.hovered_button, button):
+            if changed is not None:
+                changed.hovered = changed is button
+                dirty_rects.append(changed.get_rect())
+        self.hovered_button = button
+        return dirty_rects
+
+    def _get_button_at(self, mouse_x: int, mouse_y: int) -> SelectableButton[T] | None:
+        """Get the enabled button under the mouse.
+
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
+
+        Returns:
+            The button under the mouse, or None if there is none.
+        """
+        index = pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self.hit_rects)
+        if index == -1:
+            return None
+        return self.hit_buttons[index]
+
+    def _render_background(self) -> pygame.Surface:
+        """Render everything that stays the same while the dialog is open.
+
+        Buttons are drawn in their plain state, so only hovered or selected
+        buttons have to be drawn on top of the background each frame.
+
+        Returns:
+            The dialog background covering the whole screen.
+        """
+        background = self.screen.copy()
+
+        # Draw semi-transparent overlay
+        background.blit(self.overlay, (0, 0))
 
         # Draw dialog background
-        pygame.draw.rect(
-            self.screen,
-            (40, 40, 40),
-            (dialog_x, dialog_y, dialog_width, dialog_height),
-        )
+        pygame.draw.rect(background, (40, 40, 40), self.dialog_rect)
 
         # Draw dialog border
-        pygame.draw.rect(
-            self.screen,
-            (200, 200, 200),
-            (dialog_x, dialog_y, dialog_width, dialog_height),
-            3,
-        )
+        pygame.draw.rect(background, (200, 200, 200), self.dialog_rect, 3)
 
         # Draw title
-        font_size = int(APP_HEIGHT * 0.06)  # 6% of screen height
-        font = pygame.font.Font(None, font_size)
-        title_text = font.render(self.title, ANTI_ALIASING, (255, 255, 255))
-        title_rect = title_text.get_rect(
-            center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.06)),
-        )
-        self.screen.blit(title_text, title_rect)
+        background.blit(self.title_text, self.title_rect)
+
+        # Draw buttons in one batch
+        blits: list[Blit] = []
+        for button in self.buttons:
+            blits.extend(button.collect_blits())
+        background.blits(blits, doreturn=False)
+
+        self.background = background
+        return background
+
+    def _draw(self) -> None:
+        """Draw the selector dialog."""
+        background = self.background or self._render_background()
+        self.screen.blit(background, (0, 0))
 
-        # Draw buttons
+        # Plain buttons are already part of the background
+        blits: list[Blit] = []
         for button in self.buttons:
-            button.draw(self.screen)
+            if button.hovered or button.selected:
+                blits.extend(button.collect_blits())
+        self.screen.blits(cull_blits(self.screen, blits), doreturn=False)
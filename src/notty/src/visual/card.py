@@ -2,6 +2,7 @@
 
 from importlib import import_module
 from types import ModuleType
+from typing import ClassVar
 
 import pygame
 
@@ -19,10 +20,17 @@ class Color:
     BLACK = "black"
     BLUE = "blue"
 
+    ALL: ClassVar[frozenset[str]] = frozenset({RED, GREEN, YELLOW, BLACK, BLUE})
+
+    # Stable index per color, used to build color bitmasks
+    INDEX: ClassVar[dict[str, int]] = {
+        color: index for index, color in enumerate(sorted(ALL))
+    }
+
     @classmethod
-    def get_all_colors(cls) -> set[str]:
+    def get_all_colors(cls) -> frozenset[str]:
         """Get all colors."""
-        return {cls.RED, cls.GREEN, cls.YELLOW, cls.BLACK, cls.BLUE}
+        return cls.ALL
 
 
 class Number:
@@ -38,15 +46,26 @@ class Number:
     EIGHT = 8
     NINE = 9
 
+    ALL: ClassVar[tuple[int, ...]] = tuple(range(ONE, NINE + 1))
+
     @classmethod
-    def get_all_numbers(cls) -> range:
+    def get_all_numbers(cls) -> tuple[int, ...]:
         """Get all numbers."""
-        return range(1, 10)
+        return cls.ALL
 
 
 class VisualCard(Visual):
     """Visual card."""
 
+    __slots__ = ("color", "color_bit", "number", "number_bit", "packed")
+
+    # Card image packages by color, imported once per color
+    _COLOR_MODULE_CACHE: ClassVar[dict[str, ModuleType]] = {}
+    # Card images at board size, shared by both copies of each card
+    _PNG_CACHE: ClassVar[dict[int, pygame.Surface]] = {}
+    # Card images scaled for dialogs, keyed by (packed, width, height)
+    _SCALED_PNG_CACHE: ClassVar[dict[tuple[int, int, int], pygame.Surface]] = {}
+
     def __init__(
         self,
         color: str,
@@ -66,13 +85,51 @@ class VisualCard(Visual):
         """
         self.color = color
         self.number = number
+        # Single-bit masks so groups can be checked with integer operations
+        self.color_bit = 1 << Color.INDEX[color]
+        self.number_bit = 1 << number
+        # Colour index and number in one int, ordered like (color, number)
+        self.packed = Color.INDEX[color] << 8 | number
         super().__init__(x, y, CARD_HEIGHT, CARD_WIDTH, screen)
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
         return f"{self.number}"
 
+    def load_png(self) -> pygame.Surface:
+        """Load the card image, decoding each color and number only once.
+
+        Returns:
+            The card image scaled to the card size.
+        """
+        png = self._PNG_CACHE.get(self.packed)
+        if png is None:
+            png = super().load_png()
+            self._PNG_CACHE[self.packed] = png
+        return png
+
+    def get_scaled_png(self, width: int, height: int) -> pygame.Surface:
+        """Get the card image scaled to a size, shared by all equal cards.
+
+        Args:
+            width: Width of the scaled image.
+            height: Height of the scaled image.
+
+        Returns:
+            The scaled card image in display format.
+        """
+        key = (self.packed, width, height)
+        image = self._SCALED_PNG_CACHE.get(key)
+        if image is None:
+            image = pygame.transform.scale(self.png, (width, height)).convert_alpha()
+            self._SCALED_PNG_CACHE[key] = image
+        return image
+
     def get_png_pkg(self) -> ModuleType:
         """Get the png for the visual element."""
-        card_mod_name = cards.__name__ + "." + self.color
-        return import_module(str(card_mod_name))
+        module = self._COLOR_MODULE_CACHE.get(self.color)
+        if module is None:
+            card_mod_name = cards.__name__ + "." + self.color
+            module = import_module(str(card_mod_name))
+            self._COLOR_MODULE_CACHE[self.color] = module
+        return module
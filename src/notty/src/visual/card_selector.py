@@ -5,7 +5,12 @@ from typing import TYPE_CHECKING
 import pygame
 
 from notty.src.consts import APP_HEIGHT, APP_WIDTH
-from notty.src.visual.base_selector import BaseSelector, SelectableButton
+from notty.src.visual.base import Blit
+from notty.src.visual.base_selector import (
+    BaseSelector,
+    SelectableButton,
+    get_grid_positions,
+)
 
 if TYPE_CHECKING:
     from notty.src.visual.card import VisualCard
@@ -14,6 +19,8 @@ if TYPE_CHECKING:
 class CardButton(SelectableButton["VisualCard"]):
     """Represents a clickable card button."""
 
+    BORDER_PADDING = 5
+
     def __init__(  # noqa: PLR0913, PLR0917
         self,
         x: int,
@@ -45,37 +52,65 @@ class CardButton(SelectableButton["VisualCard"]):
         )
         self.card = card
         self.card_image = card_image
+        # Border and card image baked into one surface per hover state
+        self.normal_surface = self._compose(
+            (255, 255, 255),  # White
+            3,
+        )
+        self.hovered_surface = self._compose(
+            (100, 200, 255),  # Light blue for hover
+            5,
+        )
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
+    def _compose(
+        self,
+        border_color: tuple[int, int, int],
+        border_width: int,
+    ) -> pygame.Surface:
+        """Render the border and the card image onto one surface.
 
         Args:
-            screen: The pygame display surface.
+            border_color: Color of the border.
+            border_width: Thickness of the border.
+
+        Returns:
+            The button surface, including the border padding.
         """
-        # Determine border color based on state
-        if self.hovered:
-            border_color = (100, 200, 255)  # Light blue for hover
-            border_width = 5
-        else:
-            border_color = (255, 255, 255)  # White
-            border_width = 3
-
-        # Draw border
-        border_padding = 5
-        pygame.draw.rect(
-            screen,
-            border_color,
+        surface = pygame.Surface(
             (
-                self.x - border_padding,
-                self.y - border_padding,
-                self.width + 2 * border_padding,
-                self.height + 2 * border_padding,
+                self.width + 2 * self.BORDER_PADDING,
+                self.height + 2 * self.BORDER_PADDING,
             ),
-            border_width,
+            pygame.SRCALPHA,
         )
+        pygame.draw.rect(surface, border_color, surface.get_rect(), border_width)
+        # The area under the image is still clear, so taking the maximum
+        # copies the image with its alpha instead of blending it
+        surface.blit(
+            self.card_image,
+            (self.BORDER_PADDING, self.BORDER_PADDING),
+            special_flags=pygame.BLEND_RGBA_MAX,
+        )
+        return surface.convert_alpha()
 
-        # Draw card image
-        screen.blit(self.card_image, (self.x, self.y))
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area the button draws into, including the border.
+
+        Returns:
+            The bounding rect of the button.
+        """
+        return self.rect.inflate(2 * self.BORDER_PADDING, 2 * self.BORDER_PADDING)
+
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the button in its current state.
+
+        Returns:
+            The pre-rendered surface for the current state at the button.
+        """
+        surface = self.hovered_surface if self.hovered else self.normal_surface
+        return [
+            (surface, (self.x - self.BORDER_PADDING, self.y - self.BORDER_PADDING)),
+        ]
 
 
 class CardSelector(BaseSelector["VisualCard"]):
@@ -132,19 +167,17 @@ class CardSelector(BaseSelector["VisualCard"]):
 
         # Calculate starting position
         start_y = int(APP_HEIGHT // 2 - (num_rows * (card_height + card_spacing)) // 2)
+        positions = get_grid_positions(
+            num_cards,
+            (card_width, card_height),
+            card_spacing,
+            start_y=start_y,
+            max_per_row=max_cards_per_row,
+        )
 
         # Create buttons for each card
-        for i, card in enumerate(self.items):
-            row = i // max_cards_per_row
-            col = i % max_cards_per_row
-            cards_in_row = min(max_cards_per_row, num_cards - row * max_cards_per_row)
-            row_width = cards_in_row * card_width + (cards_in_row - 1) * card_spacing
-            start_x = int((APP_WIDTH - row_width) // 2)
-
-            x = start_x + col * (card_width + card_spacing)
-            y = start_y + row * (card_height + card_spacing)
-
+        for card, (x, y) in zip(self.items, positions, strict=True):
             # Scale card image
-            card_image = pygame.transform.scale(card.png, (card_width, card_height))
+            card_image = card.get_scaled_png(card_width, card_height)
             button = CardButton(x, y, card_width, card_height, card, card_image)
             self.buttons.append(button)
@@ -6,7 +6,12 @@ from typing import TYPE_CHECKING
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
-from notty.src.visual.base_selector import BaseSelector, SelectableButton
+from notty.src.visual.base import Blit, get_border_surface, get_font
+from notty.src.visual.base_selector import (
+    BaseSelector,
+    SelectableButton,
+    get_grid_positions,
+)
 
 if TYPE_CHECKING:
     from notty.src.visual.card import VisualCard
@@ -15,6 +20,8 @@ if TYPE_CHECKING:
 class MultiCardButton(SelectableButton["VisualCard"]):
     """Represents a clickable card button that can be selected/deselected."""
 
+    BORDER_PADDING = 5
+
     def __init__(  # noqa: PLR0913, PLR0917
         self,
         x: int,
@@ -47,55 +54,70 @@ class MultiCardButton(SelectableButton["VisualCard"]):
         self.card = card
         self.card_image = card_image
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
+        # Pre-render the border for every state around the padded card
+        border_size = (
+            self.width + 2 * self.BORDER_PADDING,
+            self.height + 2 * self.BORDER_PADDING,
+        )
+        self.normal_border = get_border_surface(*border_size, (255, 255, 255), 3)
+        self.hovered_border = get_border_surface(*border_size, (100, 200, 255), 5)
+        self.selected_border = get_border_surface(*border_size, (50, 255, 50), 6)
+
+        # Semi-transparent green overlay and checkmark shown when selected
+        self.selected_overlay = pygame.Surface(
+            (self.width, self.height),
+            pygame.SRCALPHA,
+        )
+        self.selected_overlay.fill((50, 255, 50, 80))
+        self.selected_overlay = self.selected_overlay.convert_alpha()
+        # scale font size based on card height
+        font_size = int(self.height * 0.53)  # 53% of card height
+        font = get_font(font_size)
+        self.checkmark = font.render(
+            "✓",
+            ANTI_ALIASING,
+            (255, 255, 255),
+        ).convert_alpha()
+        self.checkmark_rect = self.checkmark.get_rect(
+            center=(self.x + self.width // 2, self.y + self.height // 2),
+        )
 
-        Args:
-            screen: The pygame display surface.
-        """
-        # Determine border color based on state
-        if self.selected:
-            border_color = (50, 255, 50)  # Green for selected
-            border_width = 6
-        elif self.hovered:
-            border_color = (100, 200, 255)  # Light blue for hover
-            border_width = 5
-        else:
-            border_color = (255, 255, 255)  # White
-            border_width = 3
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area the button draws into, including its border.
 
-        # Draw border
-        border_padding = 5
-        pygame.draw.rect(
-            screen,
-            border_color,
-            (
-                self.x - border_padding,
-                self.y - border_padding,
-                self.width + 2 * border_padding,
-                self.height + 2 * border_padding,
-            ),
-            border_width,
+        Returns:
+            The bounding rect of the button.
+        """
+        return (
+            super()
+            .get_rect()
+            .inflate(
+                2 * self.BORDER_PADDING,
+                2 * self.BORDER_PADDING,
+            )
         )
 
-        # Draw card image
-        screen.blit(self.card_image, (self.x, self.y))
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the button in its current state.
 
-        # Draw checkmark if selected
+        Returns:
+            The border, card image and selection marks, in drawing order.
+        """
         if self.selected:
-            # Draw a semi-transparent green overlay
-            overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            overlay.fill((50, 255, 50, 80))
-            screen.blit(overlay, (self.x, self.y))
-
-            # Draw checkmark - scale font size based on card height
-            font_size = int(self.height * 0.53)  # 53% of card height
-            font = pygame.font.Font(None, font_size)
-            checkmark = font.render("✓", ANTI_ALIASING, (255, 255, 255))
-            checkmark_rect = checkmark.get_rect(
-                center=(self.x + self.width // 2, self.y + self.height // 2),
-            )
-            screen.blit(checkmark, checkmark_rect)
+            border = self.selected_border
+        elif self.hovered:
+            border = self.hovered_border
+        else:
+            border = self.normal_border
+        blits: list[Blit] = [
+            (border, (self.x - self.BORDER_PADDING, self.y - self.BORDER_PADDING)),
+            (self.card_image, (self.x, self.y)),
+        ]
+        if self.selected:
+            # Semi-transparent green overlay with a checkmark on top
+            blits.append((self.selected_overlay, (self.x, self.y)))
+            blits.append((self.checkmark, self.checkmark_rect.topleft))
+        return blits
 
 
 class SubmitButton:
@@ -116,6 +138,26 @@ class SubmitButton:
         self.height = height
         self.hovered = False
         self.enabled = False
+        self.rect = pygame.Rect(x, y, width, height)
+
+        # Pre-render the label in every color it can be drawn with
+        font_size = int(self.height * 0.72)  # 72% of button height
+        font = get_font(font_size)
+        self.label_texts = {
+            color: font.render("Submit", ANTI_ALIASING, color).convert_alpha()
+            for color in ((150, 150, 150), (0, 0, 0), (255, 255, 255))
+        }
+        self.label_rect = self.label_texts[255, 255, 255].get_rect(
+            center=(self.x + self.width // 2, self.y + self.height // 2),
+        )
+
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area the button draws into.
+
+        Returns:
+            The bounding rect of the button.
+        """
+        return self.rect.copy()
 
     def is_clicked(self, mouse_x: int, mouse_y: int) -> bool:
         """Check if the button was clicked.
@@ -129,10 +171,7 @@ class SubmitButton:
         """
         if not self.enabled:
             return False
-        return (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        return self.rect.collidepoint(mouse_x, mouse_y)
 
     def update_hover(self, mouse_x: int, mouse_y: int) -> None:
         """Update hover state based on mouse position.
@@ -141,10 +180,7 @@ class SubmitButton:
             mouse_x: Mouse x coordinate.
             mouse_y: Mouse y coordinate.
         """
-        self.hovered = (
-            self.x <= mouse_x <= self.x + self.width
-            and self.y <= mouse_y <= self.y + self.height
-        )
+        self.hovered = self.rect.collidepoint(mouse_x, mouse_y)
 
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the button.
@@ -177,14 +213,8 @@ class SubmitButton:
             3,
         )
 
-        # Draw button text - scale font size based on button height
-        font_size = int(self.height * 0.72)  # 72% of button height
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render("Submit", ANTI_ALIASING, text_color)
-        text_rect = text_surface.get_rect(
-            center=(self.x + self.width // 2, self.y + self.height // 2),
-        )
-        screen.blit(text_surface, text_rect)
+        # Draw button text
+        screen.blit(self.label_texts[text_color], self.label_rect)
 
 
 class CardsSelector(BaseSelector["VisualCard"]):
@@ -249,20 +279,18 @@ class CardsSelector(BaseSelector["VisualCard"]):
             - (num_rows * (card_height + card_spacing)) // 2
             - int(APP_HEIGHT * 0.06),
         )
+        positions = get_grid_positions(
+            num_cards,
+            (card_width, card_height),
+            card_spacing,
+            start_y=start_y,
+            max_per_row=max_cards_per_row,
+        )
 
         # Create buttons for each card
-        for i, card in enumerate(self.items):
-            row = i // max_cards_per_row
-            col = i % max_cards_per_row
-            cards_in_row = min(max_cards_per_row, num_cards - row * max_cards_per_row)
-            row_width = cards_in_row * card_width + (cards_in_row - 1) * card_spacing
-            start_x = int((APP_WIDTH - row_width) // 2)
-
-            x = start_x + col * (card_width + card_spacing)
-            y = start_y + row * (card_height + card_spacing)
-
+        for card, (x, y) in zip(self.items, positions, strict=True):
             # Scale card image
-            card_image = pygame.transform.scale(card.png, (card_width, card_height))
+            card_image = card.get_scaled_png(card_width, card_height)
             button = MultiCardButton(x, y, card_width, card_height, card, card_image)
             self.buttons.append(button)
 
@@ -290,59 +318,90 @@ class CardsSelector(BaseSelector["VisualCard"]):
             The list of selected cards.
         """
         clock = pygame.time.Clock()
-
-        while True:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    raise SystemExit
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-
-                    # Check if submit button was clicked
-                    if self.submit_button and self.submit_button.is_clicked(
-                        mouse_x,
-                        mouse_y,
-                    ):
-                        return self._get_selected_items()
-
-                    # Check if any card button was clicked
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_x, mouse_y):
+        self._render_background()
+        self._update_hover(*pygame.mouse.get_pos())
+        # Show the dialog before blocking on the first event
+        self._present(redraw=True, dirty_rects=[])
+        redraw = False
+
+        with self._ignoring_unused_events():
+            while True:
+                # Handle events
+                # Only the last mouse position of a batch matters for hover
+                mouse_pos: tuple[int, int] | None = None
+                for event in self._wait_for_events():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        raise SystemExit
+                    if event.type == pygame.MOUSEMOTION:
+                        mouse_pos = event.pos
+                        continue
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        mouse_x, mouse_y = event.pos
+
+                        # Check if submit button was clicked
+                        if self.submit_button and self.submit_button.is_clicked(
+                            mouse_x,
+                            mouse_y,
+                        ):
+                            return self._get_selected_items()
+
+                        # Check if any card button was clicked
+                        button = self._get_button_at(mouse_x, mouse_y)
+                        if button is not None:
                             button.toggle_selection(
                                 len(self._get_selected_items()),
                                 self.max_selections,
                             )
                             self._update_submit_button_state()
-                            break
+                            redraw = True
+
+                dirty_rects = (
+                    [] if mouse_pos is None else self._update_hover(*mouse_pos)
+                )
+                self._present(redraw=redraw, dirty_rects=dirty_rects)
+                redraw = False
+                clock.tick(60)  # 60 FPS
+
+    def _update_hover(self, mouse_x: int, mouse_y: int) -> list[pygame.Rect]:
+        """Update the hover state of the card and submit buttons.
+
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
 
-            # Update hover state
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            for button in self.buttons:
-                button.update_hover(mouse_x, mouse_y)
-            if self.submit_button:
-                self.submit_button.update_hover(mouse_x, mouse_y)
+        Returns:
+            The rects of the buttons whose hover state changed.
+        """
+        dirty_rects = super()._update_hover(mouse_x, mouse_y)
+        if self.submit_button:
+            hovered = self.submit_button.hovered
+            self.submit_button.update_hover(mouse_x, mouse_y)
+            if self.submit_button.hovered != hovered:
+                dirty_rects.append(self.submit_button.get_rect())
+        return dirty_rects
 
-            # Draw
-            self._draw()
+    def _get_present_rect(self) -> pygame.Rect:
+        """Get the area that can change when the dialog is redrawn.
 
-            # Update display
-            pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+        Returns:
+            The dialog rect, grown to cover all buttons and the submit button.
+        """
+        rect = super()._get_present_rect()
+        if self.submit_button:
+            rect.union_ip(self.submit_button.get_rect())
+        return rect
 
     def _draw(self) -> None:
         """Draw the cards selector dialog."""
-        # Call base class _draw to handle overlay, dialog, title, and buttons
+        # Call base class _draw to handle the background and changed buttons
         super()._draw()
 
-        # Get dialog dimensions for positioning
-        _dialog_width, dialog_height = self._get_dialog_dimensions()
-        dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        dialog_y = self.dialog_rect.y
 
         # Draw instruction - scale font size
         instruction_font_size = int(APP_HEIGHT * 0.034)  # 3.4% of screen height
-        instruction_font = pygame.font.Font(None, instruction_font_size)
+        instruction_font = get_font(instruction_font_size)
         selected_cards = self._get_selected_items()
         is_valid = self._is_valid_selection()
 
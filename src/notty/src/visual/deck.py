@@ -14,7 +14,7 @@ from notty.src.consts import (
     DECK_POS_Y,
     DECK_WIDTH,
 )
-from notty.src.visual.base import Visual
+from notty.src.visual.base import Blit, Visual, get_font
 from notty.src.visual.card import Color, Number, VisualCard
 
 
@@ -23,28 +23,37 @@ class VisualDeck(Visual):
 
     NUM_DUPLICATES = 2
 
-    def draw(self) -> None:
-        """Draw the visual element."""
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the deck and its card count.
+
+        Returns:
+            The surfaces to blit with their positions, in drawing order.
+        """
+        blits: list[Blit] = []
         for card in self.cards:
-            card.draw()
-        super().draw()
+            blits.extend(card.collect_blits())
+        blits.extend(super().collect_blits())
         # Cards stay hidden behind the deck - only draw the deck image
         # draw the number of cards in the deck in black - scale font size
         font_size = int(APP_HEIGHT * 0.12)  # 12% of screen height
-        font = pygame.font.Font(None, font_size)
+        font = get_font(font_size)
         text = font.render(str(self.size()), ANTI_ALIASING, (0, 0, 0))
         text_padding = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
-        self.screen.blit(text, (self.x + text_padding, self.y + text_padding))
+        blits.append((text, (self.x + text_padding, self.y + text_padding)))
+        return blits
 
     def __init__(
         self,
         screen: pygame.Surface,
+        rng: random.Random | None = None,
     ) -> None:
         """Initialize a visual deck.
 
         Args:
             screen: The pygame display surface.
+            rng: Random number generator for shuffling, a new one if None.
         """
+        self.rng = rng if rng is not None else random.Random()  # noqa: S311  # nosec: B311
         self.cards: list[VisualCard] = []
         super().__init__(DECK_POS_X, DECK_POS_Y, DECK_HEIGHT, DECK_WIDTH, screen)
         self._initialize_deck()
@@ -69,7 +78,7 @@ class VisualDeck(Visual):
 
     def shuffle(self) -> None:
         """Shuffle the deck."""
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
 
     def draw_card(self) -> VisualCard:
         """Draw the top card from the deck.
@@ -114,11 +123,13 @@ class VisualDeck(Visual):
         Args:
             card: VisualCard to add back to the deck.
         """
-        self.cards.append(card)
+        # put the card at a random position, the rest of the deck is
+        # already shuffled so this is as random as shuffling it again
+        index = self.rng.randint(0, len(self.cards))
+        self.cards.insert(index, card)
         # move the card to the middle of the deck
         x, y = self.get_center()
         card.move(x, y)
-        self.shuffle()
 
     def is_empty(self) -> bool:
         """Check if the deck is empty.
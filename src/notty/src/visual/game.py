@@ -1,8 +1,10 @@
 """visual game."""
 
 import itertools
+import random
+from collections.abc import Callable, Iterator
 from types import ModuleType
-from typing import cast
+from typing import ClassVar, cast
 
 import pygame
 
@@ -18,7 +20,7 @@ from notty.src.consts import (
     TOTAL_CARDS,
 )
 from notty.src.visual.action_board import Action, ActionBoard
-from notty.src.visual.base import Visual
+from notty.src.visual.base import Visual, get_border_surface
 from notty.src.visual.card import VisualCard
 from notty.src.visual.card_selector import CardSelector
 from notty.src.visual.cards_selector import CardsSelector
@@ -28,19 +30,57 @@ from notty.src.visual.player import VisualPlayer
 from notty.src.visual.player_selector import PlayerSelector
 
 
+def group_bits_are_valid(number_bits: int, color_bits: int, num_cards: int) -> bool:
+    """Check if a group of cards is valid from its bitmasks alone.
+
+    Args:
+        number_bits: OR of the number bits of all cards.
+        color_bits: OR of the colour bits of all cards.
+        num_cards: Number of cards in the group.
+
+    Returns:
+        True if group is valid.
+    """
+    # A sequence of at least three cards of the same colour
+    # with consecutive numbers (e.g. blue 4, blue 5 and blue 6).
+    # Distinct consecutive numbers form one unbroken run of bits.
+    min_cards = 3
+    if num_cards >= min_cards and color_bits.bit_count() == 1:
+        lowest_bit = number_bits & -number_bits
+        return number_bits == lowest_bit * ((1 << num_cards) - 1)
+
+    # A set of at least four cards of the same number
+    # but different colours (e.g. blue 4, green 4 and red 4).
+    # Note that no repeated colours are allowed in this type of group
+    # (e.g. blue 4, red 4 and blue 4 is not a valid group)
+    min_cards = 4
+    return (
+        num_cards >= min_cards
+        and number_bits.bit_count() == 1
+        and color_bits.bit_count() == num_cards
+    )
+
+
 class VisualGame(Visual):
     """visual game class."""
 
+    # Action counts at the start of a turn, copied instead of rebuilt
+    NO_ACTIONS_USED: ClassVar[dict[str, int]] = dict.fromkeys(Action.ALL, 0)
+
     def __init__(
         self,
         screen: pygame.Surface,
         players: list[VisualPlayer],
+        *,
+        seed: int | None = None,
     ) -> None:
         """Initialize a visual game.
 
         Args:
             players: List of players.
             screen: The pygame display surface.
+            seed: Seed for the game's random number generator, so that
+                shuffles can be replayed. Random if None.
         """
         super().__init__(0, 0, APP_HEIGHT, APP_WIDTH, screen)
         self.num_players = len(players)
@@ -52,12 +92,17 @@ class VisualGame(Visual):
             raise ValueError(msg)
 
         self.players = players
-        self.deck = VisualDeck(screen=self.screen)
+        # One generator for all shuffles and steals of this game
+        self.rng = random.Random(seed)  # noqa: S311  # nosec: B311
+        for player in players:
+            player.hand.rng = self.rng
+        self.deck = VisualDeck(screen=self.screen, rng=self.rng)
         self.current_player_index = 0
+        self._other_players = self._collect_other_players()
         self.winner: VisualPlayer | None = None
 
         # Track which actions have been used how many times
-        self.actions_used: dict[str, int] = dict.fromkeys(Action.get_all_actions(), 0)
+        self.actions_used: dict[str, int] = self.NO_ACTIONS_USED.copy()
 
         # Create action board for human player
         self.action_board = self._create_action_board()
@@ -66,14 +111,31 @@ class VisualGame(Visual):
         self.last_computer_action_time = 0
         self.computer_action_delay = 1000  # 1 second in milliseconds
 
+        # Whether the game state changed since the last frame was drawn
+        self.dirty = True
+
+        # Bumped on every action so results derived from the game state
+        # can be reused until the next action
+        self.state_version = 0
+        self._possible_actions: list[str] = []
+        self._possible_actions_version = -1
+
+        # Discard group results for the current hand, keyed by _get_hand_key
+        self._can_discard_key: tuple[int, int] | None = None
+        self._can_discard = False
+        self._discardable_groups_key: tuple[int, int] | None = None
+        self._discardable_groups: list[list[VisualCard]] = []
+
         self.setup()
 
     def draw(self) -> None:
         """Draw the game."""
-        super().draw()
-        self.deck.draw()
+        # Batch all image blits of the board into a single call
+        blits = self.collect_blits()
+        blits.extend(self.deck.collect_blits())
         for player in self.players:
-            player.draw()
+            blits.extend(player.collect_blits())
+        self.screen.blits(blits, doreturn=False)
         self.draw_current_player_border()
         self.action_board.draw()
 
@@ -86,17 +148,23 @@ class VisualGame(Visual):
         border_width = 5
         border_padding = 10
 
-        pygame.draw.rect(
-            self.screen,
+        border = get_border_surface(
+            hand.width + 2 * border_padding,
+            hand.height + 2 * border_padding,
             (0, 0, 0),  # Black color
-            (
-                hand.x - border_padding,
-                hand.y - border_padding,
-                hand.width + 2 * border_padding,
-                hand.height + 2 * border_padding,
-            ),
             border_width,
         )
+        self.screen.blit(border, (hand.x - border_padding, hand.y - border_padding))
+
+    def is_animating(self) -> bool:
+        """Check if any card is still moving toward its target position.
+
+        Returns:
+            True if at least one card is moving.
+        """
+        return any(card.is_moving() for card in self.deck.cards) or any(
+            card.is_moving() for player in self.players for card in player.hand.cards
+        )
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
@@ -149,13 +217,25 @@ class VisualGame(Visual):
         """Mark that the computer has taken an action."""
         self.last_computer_action_time = pygame.time.get_ticks()
 
-    def get_other_players(self) -> list[VisualPlayer]:
+    def get_other_players(self) -> tuple[VisualPlayer, ...]:
         """Get all players except the current player.
 
+        The result only changes with the turn, so it is built in next_turn.
+
         Returns:
-            List of other players.
+            Tuple of other players.
         """
-        return [p for i, p in enumerate(self.players) if i != self.current_player_index]
+        return self._other_players
+
+    def _collect_other_players(self) -> tuple[VisualPlayer, ...]:
+        """Collect all players except the current player.
+
+        Returns:
+            Tuple of other players.
+        """
+        return tuple(
+            p for i, p in enumerate(self.players) if i != self.current_player_index
+        )
 
     def get_next_player(self) -> VisualPlayer:
         """Get the next player.
@@ -176,22 +256,25 @@ class VisualGame(Visual):
     def next_turn(self) -> None:
         """Move to the next player's turn."""
         self.current_player_index = self.get_next_player_index()
+        self._other_players = self._collect_other_players()
 
         # Reset action tracking for new turn
-        self.actions_used = dict.fromkeys(Action.get_all_actions(), False)
-
-        # check all player shave not more than MAX_HAND_SIZE cards
-        for player in self.players:
-            if player.hand.size() > MAX_HAND_SIZE:
-                msg = "Hand size exceeded"
+        self.actions_used = self.NO_ACTIONS_USED.copy()
+
+        # invariant checks only, they are skipped when running with python -O
+        if __debug__:
+            total_cards = self.deck.size()
+            for player in self.players:
+                hand_size = player.hand.size()
+                # check all players have not more than MAX_HAND_SIZE cards
+                if hand_size > MAX_HAND_SIZE:
+                    msg = "Hand size exceeded"
+                    raise ValueError(msg)
+                total_cards += hand_size
+            # check total number of cards is 90
+            if total_cards != TOTAL_CARDS:
+                msg = "Total number of cards is not 90"
                 raise ValueError(msg)
-        # check total number of cards is 90
-        total_cards = (
-            sum(player.hand.size() for player in self.players) + self.deck.size()
-        )
-        if total_cards != TOTAL_CARDS:
-            msg = "Total number of cards is not 90"
-            raise ValueError(msg)
 
     def check_win_condition(self) -> bool:
         """Check if any player has won (empty hand).
@@ -335,10 +418,11 @@ class VisualGame(Visual):
         Returns:
             True if action is available.
         """
+        # cheap checks first, scanning the other hands is the most expensive
         return (
             self.actions_used[Action.STEAL] < 1
-            and any(not p.hand.is_empty() for p in self.get_other_players())
             and not self.get_current_player().hand.hand_is_full()
+            and any(not p.hand.is_empty() for p in self.get_other_players())
         )
 
     def player_steals(self, target_player: VisualPlayer | None = None) -> bool:
@@ -358,9 +442,8 @@ class VisualGame(Visual):
             target_player = self.request_player_from_player()
 
         current_player = self.get_current_player()
-        # target player shuffles their hand before giving up a card
-        target_player.hand.shuffle()
-        card = target_player.hand.cards.pop()
+        # target player gives up a random card
+        card = target_player.hand.pop_random_card()
         current_player.hand.add_card(card)
         self.actions_used[Action.STEAL] += 1
         return True
@@ -376,7 +459,7 @@ class VisualGame(Visual):
             # Show player selector dialog for human player
 
             other_players = self.get_other_players()
-            selector = PlayerSelector(self.screen, other_players)
+            selector = PlayerSelector(self.screen, list(other_players))
             return cast("VisualPlayer", (selector.show()))
         msg = "Should not be reached"
         raise ValueError(msg)
@@ -463,66 +546,170 @@ class VisualGame(Visual):
         Returns:
             True if group is valid.
         """
-        is_valid = False
+        # OR the single-bit masks of all cards together
+        color_bits = 0
+        number_bits = 0
+        for card in cards:
+            color_bits |= card.color_bit
+            number_bits |= card.number_bit
+        return group_bits_are_valid(number_bits, color_bits, len(cards))
 
-        # order cards by number
-        cards.sort(key=lambda card: card.number)
-
-        numbers = [card.number for card in cards]
-        colors = [card.color for card in cards]
-        one_color = len(set(colors)) == 1
-        unique_colors = len(set(colors)) == len(colors)
-        consecutive_numbers = all(b - a == 1 for a, b in itertools.pairwise(numbers))
-        one_number = len(set(numbers)) == 1
-
-        # A sequence of at least three cards of the same colour
-        # with consecutive numbers (e.g. blue 4, blue 5 and blue 6)
-        min_cards = 3
-        if len(cards) >= min_cards and one_color and consecutive_numbers:
-            is_valid = True
+    def _get_hand_key(self) -> tuple[int, int]:
+        """Get a key that changes whenever the current player's hand changes.
 
-        # A set of at least four cards of the same number
-        # but different colours (e.g. blue 4, green 4 and red 4).
-        # Note that no repeated colours are allowed in this type of group
-        # (e.g. blue 4, red 4 and blue 4 is not a valid group)
-        min_cards = 4
-        if len(cards) >= min_cards and unique_colors and one_number:
-            is_valid = True
-
-        return is_valid
+        Returns:
+            Tuple of (current player index, hand version).
+        """
+        return self.current_player_index, self.get_current_player().hand.version
 
     def can_discard_group(self) -> bool:
         """Check if current player can discard a group of cards.
 
+        The result is cached until the current player's hand changes.
+
         Returns:
             True if action is available.
         """
-        # go through all card combinations and check if any are valid
-        for i in range(3, 5):
-            for cards in itertools.combinations(
-                self.get_current_player().hand.cards,
-                i,
-            ):
-                if self.card_group_is_valid(list(cards)):
-                    return True
-        return False
+        key = self._get_hand_key()
+        if self._can_discard_key == key:
+            return self._can_discard
+        if self._discardable_groups_key == key:
+            can_discard = bool(self._discardable_groups)
+        else:
+            cards = self.get_current_player().hand.cards
+            can_discard = self._has_discardable_group(cards)
+        self._can_discard_key = key
+        self._can_discard = can_discard
+        return can_discard
+
+    def _has_discardable_group(self, cards: list[VisualCard]) -> bool:
+        """Check if any valid group can be formed from the given cards.
+
+        Only needs one pass over the cards, as the numbers of each colour and
+        the colours of each number are collected as bitmasks.
+
+        Args:
+            cards: Cards to check.
+
+        Returns:
+            True if a run or a set can be formed.
+        """
+        numbers_by_color: dict[int, int] = {}
+        colors_by_number: dict[int, int] = {}
+        for card in cards:
+            numbers_by_color[card.color_bit] = (
+                numbers_by_color.get(card.color_bit, 0) | card.number_bit
+            )
+            colors_by_number[card.number_bit] = (
+                colors_by_number.get(card.number_bit, 0) | card.color_bit
+            )
+
+        # a run needs three consecutive number bits in one colour
+        if any(bits & bits >> 1 & bits >> 2 for bits in numbers_by_color.values()):
+            return True
+        # a set needs four different colour bits for one number
+        min_colors = 4
+        return any(bits.bit_count() >= min_colors for bits in colors_by_number.values())
 
     def get_discardable_groups(self) -> list[list[VisualCard]]:
         """Get all discardable groups.
 
+        The result is cached until the current player's hand changes, so
+        callers must not modify the returned lists.
+
         Returns:
             List of discardable groups.
         """
-        current_player = self.get_current_player()
-        cards = current_player.hand.cards
-        discardable_groups: list[list[VisualCard]] = []
-        for i in range(3, len(cards) + 1):
-            for cards_ in itertools.combinations(cards, i):
-                if self.card_group_is_valid(list(cards_)):
-                    discardable_groups.append(list(cards_))  # noqa: PERF401
+        key = self._get_hand_key()
+        if self._discardable_groups_key == key:
+            return self._discardable_groups
+        cards = self.get_current_player().hand.cards
+        # keep the order a plain combinations search over the hand would give
+        positions = {id(card): i for i, card in enumerate(cards)}
+        discardable_groups = sorted(
+            (
+                sorted(group, key=lambda card: positions[id(card)])
+                for group in self._iter_discardable_groups(cards)
+            ),
+            key=lambda group: (len(group), [positions[id(card)] for card in group]),
+        )
 
+        self._discardable_groups_key = key
+        self._discardable_groups = discardable_groups
         return discardable_groups
 
+    def _iter_discardable_groups(
+        self,
+        cards: list[VisualCard],
+    ) -> Iterator[list[VisualCard]]:
+        """Yield every valid group that can be formed from the given cards.
+
+        Instead of testing every combination of cards, runs are built from
+        the cards of each colour and sets from the cards of each number.
+        Duplicate cards yield one group per copy, as a combinations search
+        over the cards would.
+
+        Args:
+            cards: Cards to form the groups from.
+
+        Yields:
+            Valid groups of cards.
+        """
+        by_color: dict[str, dict[int, list[VisualCard]]] = {}
+        by_number: dict[int, dict[str, list[VisualCard]]] = {}
+        for card in cards:
+            by_color.setdefault(card.color, {}).setdefault(card.number, [])
+            by_color[card.color][card.number].append(card)
+            by_number.setdefault(card.number, {}).setdefault(card.color, [])
+            by_number[card.number][card.color].append(card)
+
+        for numbers in by_color.values():
+            yield from self._iter_runs(numbers)
+        for colors in by_number.values():
+            yield from self._iter_sets(colors)
+
+    def _iter_runs(
+        self,
+        numbers: dict[int, list[VisualCard]],
+    ) -> Iterator[list[VisualCard]]:
+        """Yield every run of at least three consecutive numbers.
+
+        Args:
+            numbers: Cards of one colour, grouped by number.
+
+        Yields:
+            Valid runs of cards.
+        """
+        min_cards = 3
+        for start in sorted(numbers):
+            end = start
+            while end + 1 in numbers:
+                end += 1
+                if end - start + 1 < min_cards:
+                    continue
+                run = (numbers[number] for number in range(start, end + 1))
+                for group in itertools.product(*run):
+                    yield list(group)
+
+    def _iter_sets(
+        self,
+        colors: dict[str, list[VisualCard]],
+    ) -> Iterator[list[VisualCard]]:
+        """Yield every set of at least four different colours.
+
+        Args:
+            colors: Cards of one number, grouped by colour.
+
+        Yields:
+            Valid sets of cards.
+        """
+        min_cards = 4
+        copies = list(colors.values())
+        for size in range(min_cards, len(copies) + 1):
+            for chosen in itertools.combinations(copies, size):
+                for group in itertools.product(*chosen):
+                    yield list(group)
+
     def player_discards_group(self, cards: list[VisualCard] | None = None) -> bool:
         """VisualPlayer discards a group of cards.
 
@@ -575,7 +762,16 @@ class VisualGame(Visual):
         """Check if all players have no cards."""
         return all(player.hand.is_empty() for player in self.players)
 
-    def action_is_possible(self, action: str) -> bool:  # noqa: PLR0911
+    ACTION_CHECKS: ClassVar[dict[str, Callable[["VisualGame"], bool]]] = {
+        Action.DRAW_MULTIPLE: player_can_draw_multiple,
+        Action.STEAL: player_can_steal,
+        Action.DRAW_DISCARD_DRAW: player_can_draw_discard_draw,
+        Action.DRAW_DISCARD_DISCARD: player_can_draw_discard_discard,
+        Action.DISCARD_GROUP: can_discard_group,
+        Action.NEXT_TURN: player_can_pass,
+    }
+
+    def action_is_possible(self, action: str) -> bool:
         """Check if an action is possible.
 
         Args:
@@ -587,41 +783,60 @@ class VisualGame(Visual):
         # "Play for Me" is handled separately in the action board
         if action == Action.PLAY_FOR_ME:
             return True
+        try:
+            check = self.ACTION_CHECKS[action]
+        except KeyError as e:
+            msg = f"Unknown action: {action}"
+            raise ValueError(msg) from e
         # make any button False except Draw discard discard
         # if Draw discard draw is 1 and Draw discard discard is 0
-        if (
+        if self.draw_discard_is_pending():
+            return action == Action.DRAW_DISCARD_DISCARD
+        return check(self)
+
+    def draw_discard_is_pending(self) -> bool:
+        """Check if the player drew in draw discard and still has to discard.
+
+        Returns:
+            True if draw discard discard is the only possible action.
+        """
+        return (
             self.actions_used[Action.DRAW_DISCARD_DRAW] == 1
             and self.actions_used[Action.DRAW_DISCARD_DISCARD] == 0
-        ):
-            return action == Action.DRAW_DISCARD_DISCARD
-        if action == Action.DRAW_MULTIPLE:
-            return self.player_can_draw_multiple()
-        if action == Action.STEAL:
-            return self.player_can_steal()
-        if action == Action.DRAW_DISCARD_DRAW:
-            return self.player_can_draw_discard_draw()
-        if action == Action.DRAW_DISCARD_DISCARD:
-            return self.player_can_draw_discard_discard()
-        if action == Action.DISCARD_GROUP:
-            return self.can_discard_group()
-        if action == Action.NEXT_TURN:
-            return self.player_can_pass()
-        msg = f"Unknown action: {action}"
-        raise ValueError(msg)
+        )
 
     def get_all_possible_actions(self) -> list[str]:
         """Get all possible actions.
 
+        The result is cached until the next action, so callers must not
+        modify the returned list.
+
         Returns:
             List of possible actions.
         """
-        return [
-            action
-            for action in Action.get_all_actions()
-            if self.action_is_possible(action)
-        ]
-
-    def do_action(  # noqa: PLR0911
+        if self._possible_actions_version != self.state_version:
+            if self.draw_discard_is_pending():
+                # the pending discard is always possible and the only option
+                self._possible_actions = [Action.DRAW_DISCARD_DISCARD]
+            else:
+                self._possible_actions = [
+                    action for action in Action.ALL if self.ACTION_CHECKS[action](self)
+                ]
+            self._possible_actions_version = self.state_version
+        return self._possible_actions
+
+    # each action maps to its handler and the do_action argument it takes
+    ACTION_HANDLERS: ClassVar[dict[str, tuple[Callable[..., bool], str | None]]] = {
+        Action.PLAY_FOR_ME: (play_for_me, None),
+        Action.DRAW_MULTIPLE: (player_draws_multiple, "count"),
+        Action.STEAL: (player_steals, "target_player"),
+        Action.DRAW_DISCARD_DRAW: (player_draw_discard_draws, None),
+        Action.DRAW_DISCARD_DISCARD: (player_draw_discard_discards, "card"),
+        Action.DISCARD_GROUP: (player_discards_group, "cards"),
+        Action.NEXT_TURN: (player_passes, None),
+    }
+
+    def do_action(
         self,
         action: str,
         count: int | None = None,
@@ -641,19 +856,19 @@ class VisualGame(Visual):
         Returns:
             True if action was successful.
         """
-        if action == Action.PLAY_FOR_ME:
-            return self.play_for_me()
-        if action == Action.DRAW_MULTIPLE:
-            return self.player_draws_multiple(count=count)
-        if action == Action.STEAL:
-            return self.player_steals(target_player=target_player)
-        if action == Action.DRAW_DISCARD_DRAW:
-            return self.player_draw_discard_draws()
-        if action == Action.DRAW_DISCARD_DISCARD:
-            return self.player_draw_discard_discards(card=card)
-        if action == Action.DISCARD_GROUP:
-            return self.player_discards_group(cards=cards)
-        if action == Action.NEXT_TURN:
-            return self.player_passes()
-        msg = f"Unknown action: {action}"
-        raise ValueError(msg)
+        self.dirty = True
+        self.state_version += 1
+        try:
+            handler, arg_name = self.ACTION_HANDLERS[action]
+        except KeyError as e:
+            msg = f"Unknown action: {action}"
+            raise ValueError(msg) from e
+        if arg_name is None:
+            return handler(self)
+        args = {
+            "count": count,
+            "card": card,
+            "cards": cards,
+            "target_player": target_player,
+        }
+        return handler(self, **{arg_name: args[arg_name]})
@@ -3,7 +3,12 @@
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
-from notty.src.visual.base_selector import BaseSelector, SelectableButton
+from notty.src.visual.base import Blit, get_font
+from notty.src.visual.base_selector import (
+    BaseSelector,
+    SelectableButton,
+    get_grid_positions,
+)
 
 
 class NumberButton(SelectableButton[int]):
@@ -42,45 +47,70 @@ class NumberButton(SelectableButton[int]):
         )
         self.number = number
 
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
+        # Pre-render the button in each of its states
+        font_size = int(self.height * 0.7)  # 70% of button height
+        font = get_font(font_size)
+        self.disabled_surface = self._render_state(
+            font,
+            bg_color=(100, 100, 100),  # Gray for disabled
+            text_color=(150, 150, 150),  # Light gray text
+            border_color=(70, 70, 70),
+        )
+        self.hovered_surface = self._render_state(
+            font,
+            bg_color=(100, 200, 255),  # Light blue for hover
+            text_color=(0, 0, 0),  # Black text
+            border_color=(50, 150, 255),
+        )
+        self.normal_surface = self._render_state(
+            font,
+            bg_color=(50, 150, 50),  # Green
+            text_color=(255, 255, 255),  # White text
+            border_color=(30, 100, 30),
+        )
+
+    def _render_state(
+        self,
+        font: pygame.font.Font,
+        *,
+        bg_color: tuple[int, int, int],
+        text_color: tuple[int, int, int],
+        border_color: tuple[int, int, int],
+    ) -> pygame.Surface:
+        """Render the button background, border and number onto one surface.
 
         Args:
-            screen: The pygame display surface.
+            font: Font to render the number with.
+            bg_color: Color of the button background.
+            text_color: Color of the number.
+            border_color: Color of the button border.
+
+        Returns:
+            The button surface.
+        """
+        surface = pygame.Surface((self.width, self.height))
+        surface.fill(bg_color)
+        pygame.draw.rect(surface, border_color, surface.get_rect(), 3)
+        text = font.render(str(self.number), ANTI_ALIASING, text_color)
+        surface.blit(
+            text,
+            text.get_rect(center=(self.width // 2, self.height // 2)),
+        )
+        return surface.convert()
+
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the button in its current state.
+
+        Returns:
+            The pre-rendered surface for the current state at the button.
         """
-        # Determine button color based on state
         if not self.enabled:
-            bg_color = (100, 100, 100)  # Gray for disabled
-            text_color = (150, 150, 150)  # Light gray text
-            border_color = (70, 70, 70)
+            surface = self.disabled_surface
         elif self.hovered:
-            bg_color = (100, 200, 255)  # Light blue for hover
-            text_color = (0, 0, 0)  # Black text
-            border_color = (50, 150, 255)
+            surface = self.hovered_surface
         else:
-            bg_color = (50, 150, 50)  # Green
-            text_color = (255, 255, 255)  # White text
-            border_color = (30, 100, 30)
-
-        # Draw button background
-        pygame.draw.rect(screen, bg_color, (self.x, self.y, self.width, self.height))
-
-        # Draw button border
-        pygame.draw.rect(
-            screen,
-            border_color,
-            (self.x, self.y, self.width, self.height),
-            3,
-        )
-
-        # Draw button text - scale font size based on button height
-        font_size = int(self.height * 0.7)  # 70% of button height
-        font = pygame.font.Font(None, font_size)
-        text_surface = font.render(str(self.number), ANTI_ALIASING, text_color)
-        text_rect = text_surface.get_rect(
-            center=(self.x + self.width // 2, self.y + self.height // 2),
-        )
-        screen.blit(text_surface, text_rect)
+            surface = self.normal_surface
+        return [(surface, self.rect.topleft)]
 
 
 class NumberSelector(BaseSelector[int]):
@@ -130,14 +160,15 @@ class NumberSelector(BaseSelector[int]):
         button_width, button_height, button_spacing = self._get_button_dimensions()
 
         # Center the buttons horizontally
-        total_width = 3 * button_width + 2 * button_spacing
-        start_x = int((APP_WIDTH - total_width) // 2)
-        y = int(APP_HEIGHT // 2 - button_height // 2)
+        positions = get_grid_positions(
+            3,
+            (button_width, button_height),
+            button_spacing,
+            start_y=int(APP_HEIGHT // 2 - button_height // 2),
+        )
 
         # Create buttons for 1, 2, 3
-        for i in range(3):
-            number = i + 1
-            x = start_x + i * (button_width + button_spacing)
+        for number, (x, y) in enumerate(positions, start=1):
             # Disable buttons that exceed max_number
             enabled = number <= self.max_number
             button = NumberButton(
@@ -1,11 +1,14 @@
 """visual player."""
 
 import random
+from bisect import bisect_right
 from importlib import resources
+from operator import attrgetter
 from types import ModuleType
 from typing import ClassVar
 
 import pygame
+from pyrig.core.resources import resource_path
 
 from notty.rig.resources.visuals import hand, players
 from notty.src.consts import (
@@ -22,9 +25,19 @@ from notty.src.consts import (
     PLAYER_HEIGHT,
     PLAYER_WIDTH,
 )
-from notty.src.visual.base import Visual
+from notty.src.visual.base import Blit, Visual
 from notty.src.visual.card import VisualCard
 
+# attrgetter fetches the sort key in C instead of calling a lambda per card
+PACKED_KEY = attrgetter("packed")
+
+# Offset of each hand slot from the hand's corner, in row-major order.
+# The spare slot holds the card drawn over the limit in a draw and discard.
+HAND_SLOT_OFFSETS = tuple(
+    ((i % NUM_HAND_COLUMNS) * CARD_WIDTH, (i // NUM_HAND_COLUMNS) * CARD_HEIGHT)
+    for i in range(MAX_HAND_SIZE + 1)
+)
+
 
 class VisualHand(Visual):
     """Represents a player's hand of cards.
@@ -47,12 +60,21 @@ class VisualHand(Visual):
             player.screen,
         )
         self.cards: list[VisualCard] = []
+        # Bumped whenever the cards in the hand change
+        self.version = 0
+        # Replaced by the game's generator once the hand joins a game
+        self.rng = random.Random()  # noqa: S311  # nosec: B311
 
-    def draw(self) -> None:
-        """Draw the hand."""
-        super().draw()
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the hand and its cards.
+
+        Returns:
+            The surfaces to blit with their positions, in drawing order.
+        """
+        blits = super().collect_blits()
         for card in self.cards:
-            card.draw()
+            blits.extend(card.collect_blits())
+        return blits
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
@@ -82,12 +104,33 @@ class VisualHand(Visual):
         Returns:
             True if the card was added, False if hand is full.
         """
+        self._append_card(card, draw_discard_draw=draw_discard_draw)
+        # Adding and removing cards keeps the hand sorted and laid out, so the
+        # new card and the cards after its slot are the only ones to move
+        last = len(self.cards) - 1
+        index = bisect_right(self.cards, card.packed, hi=last, key=PACKED_KEY)
+        if index != last:
+            self.cards.insert(index, self.cards.pop())
+        self._layout_cards(index)
+        return True
+
+    def _append_card(
+        self,
+        card: VisualCard,
+        *,
+        draw_discard_draw: bool = False,
+    ) -> None:
+        """Append a card to the hand without repositioning the cards.
+
+        Args:
+            card: The card to add.
+            draw_discard_draw: True if this is a draw and discard action.
+        """
         if self.size() >= MAX_HAND_SIZE and not draw_discard_draw:
             msg = "Hand is full"
             raise ValueError(msg)
         self.cards.append(card)
-        self.order_cards()
-        return True
+        self.version += 1
 
     def add_cards(self, cards: list[VisualCard]) -> dict[VisualCard, bool]:
         """Add multiple cards to the hand.
@@ -99,8 +142,14 @@ class VisualHand(Visual):
             A dictionary mapping each card to a boolean indicating whether it was added.
         """
         cards_added: dict[VisualCard, bool] = {}
-        for card in cards:
-            cards_added[card] = self.add_card(card)
+        try:
+            for card in cards:
+                self._append_card(card)
+                cards_added[card] = True
+        finally:
+            # reposition once for all cards, even if the hand filled up
+            if cards_added:
+                self.order_cards()
         return cards_added
 
     def remove_card(self, card: VisualCard) -> bool:
@@ -114,6 +163,7 @@ class VisualHand(Visual):
         """
         if card in self.cards:
             self.cards.remove(card)
+            self.version += 1
             # reposition all cards in hand
             self.order_cards()
             return True
@@ -121,13 +171,24 @@ class VisualHand(Visual):
 
     def order_cards(self) -> None:
         """Order the cards in the hand."""
-        self.cards.sort(key=lambda card: (card.color, card.number))
-        for i, card in enumerate(self.cards):
-            row = i // NUM_HAND_COLUMNS
-            col = i % NUM_HAND_COLUMNS
-            card_x = self.x + col * CARD_WIDTH
-            card_y = self.y + row * CARD_HEIGHT
-            card.move(card_x, card_y)
+        self.cards.sort(key=PACKED_KEY)
+        self._layout_cards(0)
+
+    def _layout_cards(self, start: int) -> None:
+        """Move the cards from a slot onwards to their place in the hand.
+
+        Args:
+            start: Index of the first card that may have changed slot.
+        """
+        x, y = self.x, self.y
+        for i in range(start, len(self.cards)):
+            card = self.cards[i]
+            dx, dy = HAND_SLOT_OFFSETS[i]
+            card_x = x + dx
+            card_y = y + dy
+            # Cards before the changed slot already head to their place
+            if card.target_x != card_x or card.target_y != card_y:
+                card.move(card_x, card_y)
 
     def remove_cards(self, cards: list[VisualCard]) -> dict[VisualCard, bool]:
         """Remove multiple cards from the hand.
@@ -138,9 +199,17 @@ class VisualHand(Visual):
         Returns:
             A dictionary mapping each card to a boolean showing whether it was removed.
         """
+        # check membership against a set and filter the hand in one pass
+        in_hand = set(self.cards)
         cards_removed: dict[VisualCard, bool] = {}
         for card in cards:
-            cards_removed[card] = self.remove_card(card)
+            cards_removed[card] = card in in_hand
+            in_hand.discard(card)
+        if len(in_hand) < len(self.cards):
+            self.cards[:] = [card for card in self.cards if card in in_hand]
+            self.version += 1
+            # reposition all cards in hand
+            self.order_cards()
         return cards_removed
 
     def is_empty(self) -> bool:
@@ -159,15 +228,30 @@ class VisualHand(Visual):
         """
         return len(self.cards)
 
-    def shuffle(self) -> None:
-        """Shuffle the cards in the hand."""
-        random.shuffle(self.cards)
+    def pop_random_card(self) -> VisualCard:
+        """Remove a uniformly random card from the hand.
+
+        Returns:
+            The removed card.
+        """
+        index = self.rng.randrange(len(self.cards))
+        card = self.cards.pop(index)
+        self.version += 1
+        # close the gap, the cards before it keep their slots
+        self._layout_cards(index)
+        return card
 
 
 class VisualPlayer(Visual):
     """Visual player."""
 
     ACTIVE_PLAYERS: ClassVar[list["VisualPlayer"]] = []
+    # Names of all players with an image, found on first use
+    _ALL_PLAYER_NAMES: ClassVar[tuple[str, ...] | None] = None
+    # Scaled player images keyed by (name, width, height)
+    _SCALED_PNG_CACHE: ClassVar[dict[tuple[str, int, int], pygame.Surface]] = {}
+    # Full-resolution player images scaled to a square, keyed by (name, size)
+    _IMAGE_CACHE: ClassVar[dict[tuple[str, int], pygame.Surface]] = {}
 
     TYPE_HUMAN = "human"
     TYPE_COMPUTER = "computer"
@@ -181,16 +265,21 @@ class VisualPlayer(Visual):
     ) -> None:
         """Initialize a visual player."""
         VisualPlayer.ACTIVE_PLAYERS.append(self)
+        # Seat position, fixed when the player joins
+        self.index = len(VisualPlayer.ACTIVE_PLAYERS) - 1
         self.name = name
         self.is_human = is_human
         x, y = self.get_coordinates()
         super().__init__(x, y, PLAYER_HEIGHT, PLAYER_WIDTH, screen)
         self.hand = VisualHand(player=self)
 
-    def draw(self) -> None:
-        """Draw the player."""
-        super().draw()
-        self.hand.draw()
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the player and their hand.
+
+        Returns:
+            The surfaces to blit with their positions, in drawing order.
+        """
+        return super().collect_blits() + self.hand.collect_blits()
 
     def get_png_name(self) -> str:
         """Get the png for the visual element."""
@@ -200,6 +289,23 @@ class VisualPlayer(Visual):
         """Get the png for the visual element."""
         return players
 
+    def get_scaled_png(self, width: int, height: int) -> pygame.Surface:
+        """Get the player image scaled to a size, shared by equal players.
+
+        Args:
+            width: Width of the scaled image.
+            height: Height of the scaled image.
+
+        Returns:
+            The scaled player image in display format.
+        """
+        key = (self.name, width, height)
+        image = self._SCALED_PNG_CACHE.get(key)
+        if image is None:
+            image = pygame.transform.scale(self.png, (width, height)).convert_alpha()
+            self._SCALED_PNG_CACHE[key] = image
+        return image
+
     def get_coordinates(self) -> tuple[int, int]:
         """Get the coordinates for the player."""
         # make all xy dependent on APP_WIDTH and APP_HEIGHT
@@ -208,7 +314,7 @@ class VisualPlayer(Visual):
         # and index of player
         num_players = MAX_PLAYERS
 
-        index = VisualPlayer.ACTIVE_PLAYERS.index(self)
+        index = self.index
 
         # Divide screen into equal spaces and center each player in their space
         player_space_width = APP_WIDTH // num_players
@@ -222,10 +328,35 @@ class VisualPlayer(Visual):
     def get_all_player_names(cls) -> list[str]:
         """Get all player names."""
         # use importlib resources to gte all files in players package
-        # that end with .png
+        # that end with .png, the package contents never change so only once
+        if cls._ALL_PLAYER_NAMES is None:
+            cls._ALL_PLAYER_NAMES = tuple(
+                f.name.removesuffix(".png")
+                for f in resources.files(players).iterdir()
+                if f.name.endswith(".png")
+            )
+        return list(cls._ALL_PLAYER_NAMES)
+
+    @classmethod
+    def get_image(cls, name: str, image_size: int) -> pygame.Surface:
+        """Load a player's image scaled to a square, reusing earlier loads.
 
-        return [
-            f.name.removesuffix(".png")
-            for f in resources.files(players).iterdir()
-            if f.name.endswith(".png")
-        ]
+        Unlike get_scaled_png this scales the original file, so large
+        dialog images stay sharp, and it needs no player instance.
+
+        Args:
+            name: The name of the player.
+            image_size: Width and height of the scaled image.
+
+        Returns:
+            The scaled player image in display format.
+        """
+        key = (name, image_size)
+        image = cls._IMAGE_CACHE.get(key)
+        if image is None:
+            png_path = resource_path(name + ".png", players)
+            img = pygame.image.load(png_path)
+            size = (image_size, image_size)
+            image = pygame.transform.scale(img, size).convert_alpha()
+            cls._IMAGE_CACHE[key] = image
+        return image
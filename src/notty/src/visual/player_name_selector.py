@@ -1,11 +1,11 @@
 """Player name selector for initial player selection."""
 
 import pygame
-from pyrig.core.resources import resource_path
 
-from notty.rig.resources.visuals import players
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.visual.base import Blit, get_border_surface, get_font
 from notty.src.visual.base_selector import BaseSelector, SelectableButton
+from notty.src.visual.player import VisualPlayer
 
 
 class PlayerNameButton(SelectableButton[str]):
@@ -47,66 +47,68 @@ class PlayerNameButton(SelectableButton[str]):
         )
         self.player_name = player_name
         self.player_image = player_image
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
-
-        Args:
-            screen: The pygame display surface.
-        """
-        # Determine border color based on state
-        if self.selected:
-            border_color = (50, 255, 50)  # Green for selected
-            border_width = 5
-        elif self.hovered:
-            border_color = (100, 200, 255)  # Light blue for hover
-            border_width = 5
-        else:
-            border_color = (255, 255, 255)  # White
-            border_width = 2
-
-        # Draw border
         border_padding = int(APP_WIDTH * 0.008)  # 0.8% of screen width
-        pygame.draw.rect(
-            screen,
-            border_color,
-            (
-                self.x - border_padding,
-                self.y - border_padding,
-                self.width + 2 * border_padding,
-                self.height + 2 * border_padding,
-            ),
-            border_width,
-        )
-
-        # Draw player image
-        screen.blit(self.player_image, (self.x, self.y))
+        self.border_rect = self.rect.inflate(2 * border_padding, 2 * border_padding)
+        border_size = self.border_rect.size
+        self.normal_border = get_border_surface(*border_size, (255, 255, 255), 2)
+        self.hovered_border = get_border_surface(*border_size, (100, 200, 255), 5)
+        self.selected_border = get_border_surface(*border_size, (50, 255, 50), 5)
 
-        # Draw player name
+        # Pre-render the name in every color it can be drawn with
         name_font_size = int(APP_HEIGHT * 0.06)  # 6% of screen height
-        name_font = pygame.font.Font(None, name_font_size)
-        color = (
-            (50, 255, 50)
-            if self.selected
-            else ((100, 200, 255) if self.hovered else (255, 255, 255))
-        )
-        name_text = name_font.render(
-            self.player_name.capitalize(),
-            ANTI_ALIASING,
-            color,
-        )
-        name_rect = name_text.get_rect(
+        name_font = get_font(name_font_size)
+        self.name_texts = {
+            color: name_font.render(
+                player_name.capitalize(),
+                ANTI_ALIASING,
+                color,
+            ).convert_alpha()
+            for color in ((50, 255, 50), (100, 200, 255), (255, 255, 255))
+        }
+        self.name_rect = self.name_texts[255, 255, 255].get_rect(
             center=(
                 self.x + self.width // 2,
                 self.y + self.height + int(APP_HEIGHT * 0.04),
             ),
         )
-        screen.blit(name_text, name_rect)
+
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area the button draws into, including border and name.
+
+        Returns:
+            The bounding rect of the button.
+        """
+        return self.border_rect.union(self.name_rect)
+
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the button in its current state.
+
+        Returns:
+            The border, player image and name, in drawing order.
+        """
+        if self.selected:
+            border, text_color = self.selected_border, (50, 255, 50)
+        elif self.hovered:
+            border, text_color = self.hovered_border, (100, 200, 255)
+        else:
+            border, text_color = self.normal_border, (255, 255, 255)
+        return [
+            (border, self.border_rect.topleft),
+            (self.player_image, self.rect.topleft),
+            (self.name_texts[text_color], self.name_rect.topleft),
+        ]
 
 
 class PlayerNameSelector(BaseSelector[str]):
     """Dialog for selecting player name(s) at game start."""
 
+    # Return submits a multi-selection, so key presses must still arrive
+    IGNORED_EVENTS = tuple(
+        event_type
+        for event_type in BaseSelector.IGNORED_EVENTS
+        if event_type != pygame.KEYDOWN
+    )
+
     def __init__(
         self,
         screen: pygame.Surface,
@@ -157,13 +159,6 @@ class PlayerNameSelector(BaseSelector[str]):
         """Set up the player name buttons."""
         image_size, _, _spacing = self._get_button_dimensions()
 
-        # Load player images
-        player_images: dict[str, pygame.Surface] = {}
-        for name in self.items:
-            png_path = resource_path(name + ".png", players)
-            img = pygame.image.load(png_path)
-            player_images[name] = pygame.transform.scale(img, (image_size, image_size))
-
         # Calculate positions - center horizontally
         player_spacing = APP_WIDTH // (len(self.items) + 1)
         for i, name in enumerate(self.items):
@@ -176,89 +171,108 @@ class PlayerNameSelector(BaseSelector[str]):
                 image_size,
                 image_size,
                 name,
-                player_images[name],
+                VisualPlayer.get_image(name, image_size),
                 enabled=True,
                 selectable=self.needs_submit,
             )
             self.buttons.append(button)
 
-    def _draw(self) -> None:
-        """Draw the player name selector."""
-        # Draw black background (no overlay for full screen)
-        self.screen.fill((0, 0, 0))
-
-        # Draw title
+    def _render_static_text(self) -> None:
+        """Render the title and instruction once for all frames."""
         title_font_size = int(APP_HEIGHT * 0.09)  # 9% of screen height
-        title_font = pygame.font.Font(None, title_font_size)
-        title_text = title_font.render(self.title, ANTI_ALIASING, (255, 255, 255))
-        title_rect = title_text.get_rect(
+        title_font = get_font(title_font_size)
+        self.title_text = title_font.render(
+            self.title,
+            ANTI_ALIASING,
+            (255, 255, 255),
+        ).convert_alpha()
+        self.title_rect = self.title_text.get_rect(
             center=(APP_WIDTH // 2, int(APP_HEIGHT * 0.12)),
         )
-        self.screen.blit(title_text, title_rect)
 
-        # Draw instruction
         instruction_font_size = int(APP_HEIGHT * 0.045)  # 4.5% of screen height
-        instruction_font = pygame.font.Font(None, instruction_font_size)
+        instruction_font = get_font(instruction_font_size)
         if self.needs_submit:
             instruction = "Click to select/deselect • Press ENTER when done"
         else:
             instruction = "Click on a player to select"
-        instruction_text = instruction_font.render(
+        self.instruction_text = instruction_font.render(
             instruction,
             ANTI_ALIASING,
             (255, 255, 255),
-        )
-        instruction_rect = instruction_text.get_rect(
+        ).convert_alpha()
+        self.instruction_rect = self.instruction_text.get_rect(
             center=(APP_WIDTH // 2, int(APP_HEIGHT * 0.22)),
         )
-        self.screen.blit(instruction_text, instruction_rect)
+
+    def _get_present_rect(self) -> pygame.Rect:
+        """Get the area that can change when the selector is redrawn.
+
+        Returns:
+            The whole screen, as the selector is full screen.
+        """
+        return self.screen.get_rect()
+
+    def _draw(self) -> None:
+        """Draw the player name selector."""
+        # Draw black background (no overlay for full screen)
+        self.screen.fill((0, 0, 0))
+
+        # Draw title and instruction
+        self.screen.blit(self.title_text, self.title_rect)
+        self.screen.blit(self.instruction_text, self.instruction_rect)
 
         # Draw buttons
         for button in self.buttons:
             button.draw(self.screen)
 
-    def show(self) -> str | list[str]:  # noqa: C901
+    def show(self) -> str | list[str]:
         """Show the player name selector and wait for user input.
 
         Returns:
             Selected player name (single) or list of names (multiple).
         """
         clock = pygame.time.Clock()
-
-        while True:
-            # Handle events
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    raise SystemExit
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
-                    for button in self.buttons:
-                        if button.is_clicked(mouse_x, mouse_y):
-                            if self.needs_submit:
-                                # Multi-select mode: toggle selection
-                                current_count = len(self._get_selected_items())
-                                button.toggle_selection(
-                                    current_count,
-                                    self.max_selections,
-                                )
-                            else:
+        self._update_hover(*pygame.mouse.get_pos())
+        # Show the dialog before blocking on the first event
+        self._present(redraw=True, dirty_rects=[])
+        redraw = False
+
+        with self._ignoring_unused_events():
+            while True:
+                # Handle events
+                # Only the last mouse position of a batch matters for hover
+                mouse_pos: tuple[int, int] | None = None
+                for event in self._wait_for_events():
+                    if event.type == pygame.QUIT:
+                        pygame.quit()
+                        raise SystemExit
+                    if event.type == pygame.MOUSEMOTION:
+                        mouse_pos = event.pos
+                        continue
+                    if event.type == pygame.MOUSEBUTTONDOWN:
+                        mouse_x, mouse_y = event.pos
+                        button = self._get_button_at(mouse_x, mouse_y)
+                        if button is not None:
+                            if not self.needs_submit:
                                 # Single-select mode: return immediately
                                 return button.item
-                elif event.type == pygame.KEYDOWN and self.needs_submit:
-                    if event.key == pygame.K_RETURN:
+                            # Multi-select mode: toggle selection
+                            current_count = len(self._get_selected_items())
+                            button.toggle_selection(current_count, self.max_selections)
+                            redraw = True
+                    elif (
+                        event.type == pygame.KEYDOWN
+                        and self.needs_submit
+                        and event.key == pygame.K_RETURN
+                    ):
                         selected = self._get_selected_items()
                         if len(selected) >= self.min_selections:
                             return selected
 
-            # Update hover state
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            for button in self.buttons:
-                button.update_hover(mouse_x, mouse_y)
-
-            # Draw
-            self._draw()
-
-            # Update display
-            pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+                dirty_rects = (
+                    [] if mouse_pos is None else self._update_hover(*mouse_pos)
+                )
+                self._present(redraw=redraw, dirty_rects=dirty_rects)
+                redraw = False
+                clock.tick(60)  # 60 FPS
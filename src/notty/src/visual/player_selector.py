@@ -5,7 +5,12 @@ from typing import TYPE_CHECKING
 import pygame
 
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
-from notty.src.visual.base_selector import BaseSelector, SelectableButton
+from notty.src.visual.base import Blit, get_border_surface, get_font
+from notty.src.visual.base_selector import (
+    BaseSelector,
+    SelectableButton,
+    get_grid_positions,
+)
 
 if TYPE_CHECKING:
     from notty.src.visual.player import VisualPlayer
@@ -45,50 +50,56 @@ class PlayerButton(SelectableButton["VisualPlayer"]):
         )
         self.player = player
         self.player_image = player_image
-
-    def draw(self, screen: pygame.Surface) -> None:
-        """Draw the button.
-
-        Args:
-            screen: The pygame display surface.
-        """
-        # Determine border color based on state
-        if self.hovered:
-            border_color = (100, 200, 255)  # Light blue for hover
-            border_width = 5
-        else:
-            border_color = (255, 255, 255)  # White
-            border_width = 3
-
-        # Draw border
         border_padding = 10
-        pygame.draw.rect(
-            screen,
-            border_color,
-            (
-                self.x - border_padding,
-                self.y - border_padding,
-                self.width + 2 * border_padding,
-                self.height + 2 * border_padding,
-            ),
-            border_width,
+        self.border_rect = self.rect.inflate(2 * border_padding, 2 * border_padding)
+        self.normal_border = get_border_surface(
+            *self.border_rect.size,
+            (255, 255, 255),
+            3,
+        )
+        self.hovered_border = get_border_surface(
+            *self.border_rect.size,
+            (100, 200, 255),
+            5,
         )
 
-        # Draw player image
-        screen.blit(self.player_image, (self.x, self.y))
-
-        # Draw player name below the image - scale font size
+        # Pre-render the name in every color it can be drawn with
         font_size = int(self.height * 0.24)  # 24% of image height
-        font = pygame.font.Font(None, font_size)
-        text_color = (100, 200, 255) if self.hovered else (255, 255, 255)
-        text_surface = font.render(self.player.name, ANTI_ALIASING, text_color)
-        text_rect = text_surface.get_rect(
+        font = get_font(font_size)
+        self.name_texts = {
+            color: font.render(player.name, ANTI_ALIASING, color).convert_alpha()
+            for color in ((100, 200, 255), (255, 255, 255))
+        }
+        self.name_rect = self.name_texts[255, 255, 255].get_rect(
             center=(
                 self.x + self.width // 2,
                 self.y + self.height + int(self.height * 0.2),
             ),
         )
-        screen.blit(text_surface, text_rect)
+
+    def get_rect(self) -> pygame.Rect:
+        """Get the screen area the button draws into, including border and name.
+
+        Returns:
+            The bounding rect of the button.
+        """
+        return self.border_rect.union(self.name_rect)
+
+    def collect_blits(self) -> list[Blit]:
+        """Collect the blits that draw the button in its current state.
+
+        Returns:
+            The border, player image and name, in drawing order.
+        """
+        if self.hovered:
+            border, text_color = self.hovered_border, (100, 200, 255)
+        else:
+            border, text_color = self.normal_border, (255, 255, 255)
+        return [
+            (border, self.border_rect.topleft),
+            (self.player_image, self.rect.topleft),
+            (self.name_texts[text_color], self.name_rect.topleft),
+        ]
 
 
 class PlayerSelector(BaseSelector["VisualPlayer"]):
@@ -137,16 +148,16 @@ class PlayerSelector(BaseSelector["VisualPlayer"]):
         # Get button dimensions
         image_size, _, button_spacing = self._get_button_dimensions()
 
-        # Calculate total width needed
-        num_players = len(self.items)
-        total_width = num_players * image_size + (num_players - 1) * button_spacing
-        start_x = int((APP_WIDTH - total_width) // 2)
-        y = int(APP_HEIGHT // 2 - image_size // 2)
+        # Center the players in one row
+        positions = get_grid_positions(
+            len(self.items),
+            (image_size, image_size),
+            button_spacing,
+            start_y=int(APP_HEIGHT // 2 - image_size // 2),
+        )
 
         # Create buttons for each player
-        for i, player in enumerate(self.items):
-            x = start_x + i * (image_size + button_spacing)
-            # Load and scale player image
-            player_image = pygame.transform.scale(player.png, (image_size, image_size))
+        for player, (x, y) in zip(self.items, positions, strict=True):
+            player_image = player.get_scaled_png(image_size, image_size)
             button = PlayerButton(x, y, image_size, image_size, player, player_image)
             self.buttons.append(button)
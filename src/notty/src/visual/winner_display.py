@@ -3,18 +3,23 @@
 from typing import TYPE_CHECKING
 
 import pygame
-from pyrig.core.resources import resource_path
 
-from notty.rig.resources.visuals import players
 from notty.src.consts import ANTI_ALIASING, APP_HEIGHT, APP_WIDTH
+from notty.src.visual.base import Blit, cull_blits, get_font
+from notty.src.visual.base_selector import EXPOSE_EVENTS
 
 if TYPE_CHECKING:
     from notty.src.visual.player import VisualPlayer
 
+# Rendered dialogs by winner name and window size
+_DIALOG_CACHE: dict[tuple[str, int, int], pygame.Surface] = {}
+
 
 class WinnerDisplay:
     """Dialog for displaying the winner of the game."""
 
+    BUTTON_RESULTS = ("new_game", "quit")
+
     def __init__(self, screen: pygame.Surface, winner: "VisualPlayer") -> None:
         """Initialize the winner display.
 
@@ -27,10 +32,8 @@ class WinnerDisplay:
         self.winner_name = winner.name
 
         # Load and scale the winner's image - scale proportionally
-        png_path = resource_path(winner.name + ".png", players)
-        img = pygame.image.load(png_path)
         image_size = int(APP_HEIGHT * 0.24)  # 24% of screen height
-        self.winner_image = pygame.transform.scale(img, (image_size, image_size))
+        self.winner_image = winner.get_image(winner.name, image_size)
 
         # Button properties - scale proportionally
         self.button_width = int(APP_WIDTH * 0.22)  # 22% of screen width
@@ -42,6 +45,13 @@ class WinnerDisplay:
         dialog_height = int(APP_HEIGHT * 0.66)  # 66% of screen height
         dialog_x = int((APP_WIDTH - dialog_width) // 2)
         dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        self.dialog_rect = pygame.Rect(dialog_x, dialog_y, dialog_width, dialog_height)
+        self.image_rect = pygame.Rect(
+            int((APP_WIDTH - image_size) // 2),
+            dialog_y + int(APP_HEIGHT * 0.17),
+            image_size,
+            image_size,
+        )
 
         # New Game button
         self.new_game_button_rect = pygame.Rect(
@@ -63,6 +73,91 @@ class WinnerDisplay:
             self.button_height,
         )
 
+        # Buttons in the order of BUTTON_RESULTS, for hit-testing in one call
+        self.button_rects = [self.new_game_button_rect, self.quit_button_rect]
+
+        # The texts never change, so render them once
+        title_font = get_font(int(APP_HEIGHT * 0.115))  # 11.5% of screen height
+        self.title_text = title_font.render(
+            "WINNER!",
+            ANTI_ALIASING,
+            (255, 215, 0),
+        ).convert_alpha()
+        self.title_rect = self.title_text.get_rect(
+            center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.07)),
+        )
+        name_font = get_font(int(APP_HEIGHT * 0.067))  # 6.7% of screen height
+        self.name_text = name_font.render(
+            self.winner_name,
+            ANTI_ALIASING,
+            (255, 255, 255),
+        ).convert_alpha()
+        self.name_rect = self.name_text.get_rect(
+            center=(
+                int(APP_WIDTH // 2),
+                self.image_rect.bottom + int(APP_HEIGHT * 0.048),
+            ),
+        )
+        button_font = get_font(int(APP_HEIGHT * 0.058))  # 5.8% of screen height
+        self.button_texts = {
+            text: button_font.render(
+                text,
+                ANTI_ALIASING,
+                (255, 255, 255),
+            ).convert_alpha()
+            for text in ("Start New Game", "Quit")
+        }
+        # The labels are centered on the buttons and may overhang them
+        self.button_text_rects = {
+            text: self.button_texts[text].get_rect(center=rect.center)
+            for text, rect in (
+                ("Start New Game", self.new_game_button_rect),
+                ("Quit", self.quit_button_rect),
+            )
+        }
+        # Everything a button draws into, label overhang included
+        self.button_areas = [
+            rect.union(self.button_text_rects[text])
+            for text, rect in (
+                ("Start New Game", self.new_game_button_rect),
+                ("Quit", self.quit_button_rect),
+            )
+        ]
+        self.button_border_radius = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
+        # 0.36% of screen height, min 2
+        self.button_border_width = max(2, int(APP_HEIGHT * 0.0036))
+
+        # Pre-render each button in both hover states, indexed by hovered
+        self.new_game_sprites = tuple(
+            self._render_button(
+                hovered=hovered,
+                normal_color=(50, 150, 50),  # Green
+                hover_color=(70, 200, 70),  # Lighter green on hover
+            )
+            for hovered in (False, True)
+        )
+        self.quit_sprites = tuple(
+            self._render_button(
+                hovered=hovered,
+                normal_color=(150, 50, 50),  # Red
+                hover_color=(200, 70, 70),  # Lighter red on hover
+            )
+            for hovered in (False, True)
+        )
+
+        # Semi-transparent overlay with the alpha in its pixels, in display format
+        self.overlay = pygame.Surface(
+            (int(APP_WIDTH), int(APP_HEIGHT)),
+            pygame.SRCALPHA,
+        ).convert_alpha()
+        self.overlay.fill((0, 0, 0, 220))
+
+        # The dialog itself, shared between dialogs for the same winner
+        self.dialog = self._render_dialog()
+
+        # Static part of the screen, rendered on first draw
+        self.background: pygame.Surface | None = None
+
         # Hover states
         self.new_game_hovered = False
         self.quit_hovered = False
@@ -76,182 +171,235 @@ class WinnerDisplay:
         Returns:
             "new_game" if user clicked Start New Game, "quit" if user clicked Quit.
         """
-        clock = pygame.time.Clock()
+        # Whether the whole window has been presented since it was exposed
+        presented = False
+        handled_events = (
+            pygame.QUIT,
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEMOTION,
+            *EXPOSE_EVENTS,
+        )
+        # Poll the mouse once, afterwards motion events carry the position
+        index = self._get_button_at(*pygame.mouse.get_pos())
+        self.new_game_hovered, self.quit_hovered = index == 0, index == 1
+        hover_changed = False
 
         while True:
             # Handle events
-            for event in pygame.event.get():
+            for event in pygame.event.get(handled_events):
                 if event.type == pygame.QUIT:
                     return "quit"
+                if event.type in EXPOSE_EVENTS:
+                    presented = False
+                if event.type == pygame.MOUSEMOTION:
+                    index = self._get_button_at(*event.pos)
+                    hovered = (index == 0, index == 1)
+                    hover_changed |= hovered != (
+                        self.new_game_hovered,
+                        self.quit_hovered,
+                    )
+                    self.new_game_hovered, self.quit_hovered = hovered
                 if event.type == pygame.MOUSEBUTTONDOWN:
-                    mouse_x, mouse_y = pygame.mouse.get_pos()
+                    # The click carries its own position
+                    index = self._get_button_at(*event.pos)
+                    if index != -1:
+                        return self.BUTTON_RESULTS[index]
+            # Drop unhandled events without creating Python objects
+            pygame.event.clear(pump=False)
+
+            # Only the buttons change, so redraw just when their hover does
+            if not presented:
+                self._draw()
+                pygame.display.flip()
+                presented = True
+            elif hover_changed:
+                self._draw_buttons()
+                pygame.display.update(self.button_areas)
+            hover_changed = False
+
+            # Nothing changes without input, so sleep until an event arrives
+            pygame.event.post(pygame.event.wait())
+
+    def _get_button_at(self, mouse_x: int, mouse_y: int) -> int:
+        """Get the button under the mouse.
 
-                    # Check if New Game button was clicked
-                    if self.new_game_button_rect.collidepoint(mouse_x, mouse_y):
-                        return "new_game"
+        Args:
+            mouse_x: Mouse x coordinate.
+            mouse_y: Mouse y coordinate.
 
-                    # Check if Quit button was clicked
-                    if self.quit_button_rect.collidepoint(mouse_x, mouse_y):
-                        return "quit"
+        Returns:
+            The index of the button in button_rects, or -1 if there is none.
+        """
+        return pygame.Rect(mouse_x, mouse_y, 1, 1).collidelist(self.button_rects)
 
-            # Update hover states
-            mouse_x, mouse_y = pygame.mouse.get_pos()
-            self.new_game_hovered = self.new_game_button_rect.collidepoint(
-                mouse_x,
-                mouse_y,
-            )
-            self.quit_hovered = self.quit_button_rect.collidepoint(mouse_x, mouse_y)
+    def _draw(self) -> None:
+        """Draw the winner display dialog."""
+        background = self.background or self._render_background()
+        # Draw the background and the buttons with their labels in one call
+        self.screen.blits(
+            cull_blits(
+                self.screen,
+                [(background, (0, 0)), *self._collect_button_blits()],
+            ),
+            doreturn=False,
+        )
 
-            # Draw
-            self._draw()
+    def _draw_buttons(self) -> None:
+        """Redraw only the buttons over their part of the background.
 
-            # Update display
-            pygame.display.flip()
-            clock.tick(60)  # 60 FPS
+        The rest of the dialog never changes, so a hover change does not have
+        to copy the whole background again.
+        """
+        background = self.background or self._render_background()
+        self.screen.blits(
+            [
+                *((background, area.topleft, area) for area in self.button_areas),
+                *cull_blits(self.screen, self._collect_button_blits()),
+            ],
+            doreturn=False,
+        )
 
-    def _draw(self) -> None:
-        """Draw the winner display dialog."""
-        # Draw semi-transparent overlay
-        overlay = pygame.Surface((int(APP_WIDTH), int(APP_HEIGHT)))
-        overlay.set_alpha(220)
-        overlay.fill((0, 0, 0))
-        self.screen.blit(overlay, (0, 0))
+    def _collect_button_blits(self) -> list[Blit]:
+        """Collect the blits that draw the buttons in their hover state.
 
-        # Draw dialog background - scale proportionally
-        dialog_width = int(APP_WIDTH * 0.52)  # 52% of screen width
-        dialog_height = int(APP_HEIGHT * 0.66)  # 66% of screen height
-        dialog_x = int((APP_WIDTH - dialog_width) // 2)
-        dialog_y = int((APP_HEIGHT - dialog_height) // 2)
+        Returns:
+            The button sprites, each followed by its label.
+        """
+        texts, text_rects = self.button_texts, self.button_text_rects
+        return [
+            (
+                self.new_game_sprites[self.new_game_hovered],
+                self.new_game_button_rect.topleft,
+            ),
+            (texts["Start New Game"], text_rects["Start New Game"].topleft),
+            (self.quit_sprites[self.quit_hovered], self.quit_button_rect.topleft),
+            (texts["Quit"], text_rects["Quit"].topleft),
+        ]
 
-        # Draw background with gradient effect (using solid color for simplicity)
-        pygame.draw.rect(
-            self.screen,
-            (20, 60, 20),  # Dark green background
-            (dialog_x, dialog_y, dialog_width, dialog_height),
+    def _render_background(self) -> pygame.Surface:
+        """Render everything that stays the same while the dialog is open.
+
+        The game behind the dialog is captured once, so the overlay darkens
+        it a single time and only the buttons are drawn on top each frame.
+
+        Returns:
+            The dialog background covering the whole screen.
+        """
+        background = self.screen.copy()
+
+        # Darken the game and put the dialog on top of it
+        background.blits(
+            [
+                (self.overlay, (0, 0)),
+                (self.dialog, self.dialog_rect.topleft),
+            ],
+            doreturn=False,
         )
 
+        self.background = background
+        return background
+
+    def _render_dialog(self) -> pygame.Surface:
+        """Render the dialog without its buttons.
+
+        It only depends on the winner and the window size, so it is cached
+        and shared by every dialog shown for the same winner.
+
+        Returns:
+            The dialog covering dialog_rect.
+        """
+        key = (self.winner_name, APP_WIDTH, APP_HEIGHT)
+        if key in _DIALOG_CACHE:
+            return _DIALOG_CACHE[key]
+
+        dialog = pygame.Surface(self.dialog_rect.size).convert()
+        # Draw in the dialog's own coordinates
+        offset = (-self.dialog_rect.x, -self.dialog_rect.y)
+        dialog_rect = dialog.get_rect()
+
+        # Draw background with gradient effect (using solid color for simplicity)
+        pygame.draw.rect(dialog, (20, 60, 20), dialog_rect)  # Dark green
+
         # Draw dialog border with gold color
         border_width = max(3, int(APP_HEIGHT * 0.006))  # 0.6% of screen height, min 3
         pygame.draw.rect(
-            self.screen,
+            dialog,
             (255, 215, 0),  # Gold border
-            (dialog_x, dialog_y, dialog_width, dialog_height),
+            dialog_rect,
             border_width,
         )
 
         # Draw inner border for extra emphasis
         inner_border_offset = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
         pygame.draw.rect(
-            self.screen,
+            dialog,
             (200, 200, 100),  # Lighter gold
-            (
-                dialog_x + inner_border_offset,
-                dialog_y + inner_border_offset,
-                dialog_width - 2 * inner_border_offset,
-                dialog_height - 2 * inner_border_offset,
-            ),
+            dialog_rect.inflate(-2 * inner_border_offset, -2 * inner_border_offset),
             max(2, int(APP_HEIGHT * 0.0024)),  # 0.24% of screen height, min 2
         )
 
-        # Draw "WINNER!" title - scale font size
-        title_font_size = int(APP_HEIGHT * 0.115)  # 11.5% of screen height
-        title_font = pygame.font.Font(None, title_font_size)
-        title_text = title_font.render("WINNER!", ANTI_ALIASING, (255, 215, 0))
-        title_rect = title_text.get_rect(
-            center=(int(APP_WIDTH // 2), dialog_y + int(APP_HEIGHT * 0.07)),
-        )
-        self.screen.blit(title_text, title_rect)
-
-        # Draw winner image with gold border
-        image_size = int(APP_HEIGHT * 0.24)  # 24% of screen height
-        image_x = int((APP_WIDTH - image_size) // 2)
-        image_y = dialog_y + int(APP_HEIGHT * 0.17)
-
         # Draw gold border around image
         border_padding = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
+        image_rect = self.image_rect.move(offset)
         pygame.draw.rect(
-            self.screen,
+            dialog,
             (255, 215, 0),  # Gold border
-            (
-                image_x - border_padding,
-                image_y - border_padding,
-                image_size + 2 * border_padding,
-                image_size + 2 * border_padding,
-            ),
+            image_rect.inflate(2 * border_padding, 2 * border_padding),
             border_width,
         )
 
-        # Draw the winner's image
-        self.screen.blit(self.winner_image, (image_x, image_y))
-
-        # Draw winner name below image - scale font size
-        name_font_size = int(APP_HEIGHT * 0.067)  # 6.7% of screen height
-        name_font = pygame.font.Font(None, name_font_size)
-        name_text = name_font.render(self.winner_name, ANTI_ALIASING, (255, 255, 255))
-        name_rect = name_text.get_rect(
-            center=(
-                int(APP_WIDTH // 2),
-                image_y + image_size + int(APP_HEIGHT * 0.048),
-            ),
-        )
-        self.screen.blit(name_text, name_rect)
-
-        # Draw buttons
-        self._draw_button(
-            self.new_game_button_rect,
-            "Start New Game",
-            hovered=self.new_game_hovered,
-            normal_color=(50, 150, 50),  # Green
-            hover_color=(70, 200, 70),  # Lighter green on hover
+        # Draw the "WINNER!" title, the winner's image and their name below it
+        dialog.blits(
+            [
+                (self.title_text, self.title_rect.move(offset).topleft),
+                (self.winner_image, image_rect.topleft),
+                (self.name_text, self.name_rect.move(offset).topleft),
+            ],
+            doreturn=False,
         )
 
-        self._draw_button(
-            self.quit_button_rect,
-            "Quit",
-            hovered=self.quit_hovered,
-            normal_color=(150, 50, 50),  # Red
-            hover_color=(200, 70, 70),  # Lighter red on hover
-        )
+        _DIALOG_CACHE[key] = dialog
+        return dialog
 
-    def _draw_button(
+    def _render_button(
         self,
-        rect: pygame.Rect,
-        text: str,
         *,
         hovered: bool,
         normal_color: tuple[int, int, int],
         hover_color: tuple[int, int, int],
-    ) -> None:
-        """Draw a button with hover effect.
+    ) -> pygame.Surface:
+        """Render the background and border of a button in one hover state.
+
+        The rounded corners are transparent through a colorkey, so blitting
+        the button draws the same pixels as drawing it in place.
 
         Args:
-            rect: The button rectangle.
-            text: The button text.
             hovered: Whether the button is hovered.
             normal_color: The normal button color.
             hover_color: The hover button color.
+
+        Returns:
+            The button surface.
         """
+        surface = pygame.Surface((self.button_width, self.button_height))
+        surface.fill((255, 0, 255))
+        rect = surface.get_rect()
+
         # Choose color based on hover state
         color = hover_color if hovered else normal_color
 
-        # Draw button background - scale border radius
-        border_radius = int(APP_HEIGHT * 0.012)  # 1.2% of screen height
-        pygame.draw.rect(self.screen, color, rect, border_radius=border_radius)
+        # Draw button background
+        border_radius = self.button_border_radius
+        pygame.draw.rect(surface, color, rect, border_radius=border_radius)
 
         # Draw button border
         border_color = (255, 215, 0) if hovered else (200, 200, 100)
-        border_width = max(2, int(APP_HEIGHT * 0.0036))  # 0.36% of screen height, min 2
         pygame.draw.rect(
-            self.screen,
+            surface,
             border_color,
             rect,
-            border_width,
+            self.button_border_width,
             border_radius=border_radius,
         )
-
-        # Draw button text - scale font size
-        button_font_size = int(APP_HEIGHT * 0.058)  # 5.8% of screen height
-        button_font = pygame.font.Font(None, button_font_size)
-        button_text = button_font.render(text, ANTI_ALIASING, (255, 255, 255))
-        text_rect = button_text.get_rect(center=rect.center)
-        self.screen.blit(button_text, text_rect)
+        surface.set_colorkey((255, 0, 255), pygame.RLEACCEL)
+        return surface.convert()
@@ -24,6 +24,10 @@ def test_run_event_loop() -> None:
     """Test function."""
 
 
+def test_wait_for_input() -> None:
+    """Test function."""
+
+
 def test_show_winner() -> None:
     """Test function."""
 
@@ -1,6 +1,10 @@
 """module."""
 
 
+def test__get_qlearning_save_path() -> None:
+    """Test function."""
+
+
 def test_get_qlearning_agent() -> None:
     """Test function."""
 
@@ -1,5 +1,9 @@
 """module."""
 
+from pathlib import Path
+
+from notty.src.qlearning_agent import ACTIONS, QLearningAgent
+
 
 class TestQLearningAgent:
     """Test class."""
@@ -27,3 +31,50 @@ class TestQLearningAgent:
 
     def test_get_stats(self) -> None:
         """Test method."""
+
+    def test_save_in_background(self, tmp_path: Path) -> None:
+        """Test method."""
+        filepath = str(tmp_path / "notty_qtable.json")
+        agent = QLearningAgent()
+        agent.q_table[3][1] = 1.5
+        agent.save_in_background(filepath)
+        # a later snapshot is written after the earlier one
+        agent.q_table[3][1] = 2.5
+        agent.total_actions = 7
+        agent.save_in_background(filepath)
+        agent.save(filepath)
+
+        loaded = QLearningAgent()
+        assert loaded.load(filepath)
+        assert loaded.q_table == agent.q_table
+        assert loaded.q_table[3][1] == 2.5  # noqa: PLR2004
+        assert loaded.total_actions == 7  # noqa: PLR2004
+        assert list(tmp_path.iterdir()) == [tmp_path / "notty_qtable.json"]
+
+    def test__serialize(self) -> None:
+        """Test method."""
+
+    def test__write(self, tmp_path: Path) -> None:
+        """Test method."""
+        path = tmp_path / "nested" / "notty_qtable.json"
+        agent = QLearningAgent()
+        agent.q_table[0][len(ACTIONS) - 1] = -0.25
+        QLearningAgent._write(str(path), agent._serialize())  # noqa: SLF001
+
+        loaded = QLearningAgent()
+        assert loaded.load(str(path))
+        assert loaded.q_table == agent.q_table
+        # the temporary file was moved into place
+        assert list(path.parent.iterdir()) == [path]
+
+    def test__join_background_save(self) -> None:
+        """Test method."""
+
+    def test__state_index(self) -> None:
+        """Test method."""
+
+    def test__count_states_learned(self) -> None:
+        """Test method."""
+
+    def test__load_q_table(self) -> None:
+        """Test method."""
@@ -23,6 +23,9 @@ class TestActionButton:
     def test_draw(self) -> None:
         """Test method."""
 
+    def test_render(self) -> None:
+        """Test method."""
+
 
 class TestActionBoard:
     """Test class."""
@@ -44,3 +47,12 @@ class TestActionBoard:
 
     def test_draw(self) -> None:
         """Test method."""
+
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
+    def test__get_panel_rect(self) -> None:
+        """Test method."""
+
+    def test__render_panel(self) -> None:
+        """Test method."""
@@ -1,6 +1,10 @@
 """module."""
 
 
+def test_get_grid_positions() -> None:
+    """Test function."""
+
+
 class TestSelectableButton:
     """Test class."""
 
@@ -19,6 +23,12 @@ class TestSelectableButton:
     def test_draw(self) -> None:
         """Test method."""
 
+    def test_get_rect(self) -> None:
+        """Test method."""
+
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
 
 class TestBaseSelector:
     """Test class."""
@@ -46,3 +56,27 @@ class TestBaseSelector:
 
     def test__draw(self) -> None:
         """Test method."""
+
+    def test__wait_for_events(self) -> None:
+        """Test method."""
+
+    def test__update_hover(self) -> None:
+        """Test method."""
+
+    def test__render_static_text(self) -> None:
+        """Test method."""
+
+    def test__present(self) -> None:
+        """Test method."""
+
+    def test__get_button_at(self) -> None:
+        """Test method."""
+
+    def test__render_background(self) -> None:
+        """Test method."""
+
+    def test__get_present_rect(self) -> None:
+        """Test method."""
+
+    def test__ignoring_unused_events(self) -> None:
+        """Test method."""
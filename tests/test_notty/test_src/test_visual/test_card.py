@@ -26,3 +26,9 @@ class TestVisualCard:
 
     def test_get_png_pkg(self) -> None:
         """Test method."""
+
+    def test_get_scaled_png(self) -> None:
+        """Test method."""
+
+    def test_load_png(self) -> None:
+        """Test method."""
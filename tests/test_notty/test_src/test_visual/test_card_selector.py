@@ -13,7 +13,13 @@ class TestCardButton:
     def test_update_hover(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
+    def test__compose(self) -> None:
+        """Test method."""
+
+    def test_get_rect(self) -> None:
         """Test method."""
 
 
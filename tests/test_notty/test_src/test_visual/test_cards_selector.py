@@ -16,7 +16,10 @@ class TestMultiCardButton:
     def test_toggle_selection(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
+    def test_get_rect(self) -> None:
         """Test method."""
 
 
@@ -35,6 +38,9 @@ class TestSubmitButton:
     def test_draw(self) -> None:
         """Test method."""
 
+    def test_get_rect(self) -> None:
+        """Test method."""
+
 
 class TestCardsSelector:
     """Test class."""
@@ -62,3 +68,9 @@ class TestCardsSelector:
 
     def test__draw(self) -> None:
         """Test method."""
+
+    def test__update_hover(self) -> None:
+        """Test method."""
+
+    def test__get_present_rect(self) -> None:
+        """Test method."""
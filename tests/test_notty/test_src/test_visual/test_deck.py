@@ -4,7 +4,7 @@
 class TestVisualDeck:
     """Test class."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
         """Test method."""
 
     def test___init__(self) -> None:
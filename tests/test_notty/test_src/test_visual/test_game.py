@@ -1,6 +1,10 @@
 """module."""
 
 
+def test_group_bits_are_valid() -> None:
+    """Test function."""
+
+
 class TestVisualGame:
     """Test class."""
 
@@ -123,3 +127,27 @@ class TestVisualGame:
 
     def test_do_action(self) -> None:
         """Test method."""
+
+    def test_is_animating(self) -> None:
+        """Test method."""
+
+    def test__get_hand_key(self) -> None:
+        """Test method."""
+
+    def test__iter_discardable_groups(self) -> None:
+        """Test method."""
+
+    def test__iter_runs(self) -> None:
+        """Test method."""
+
+    def test__iter_sets(self) -> None:
+        """Test method."""
+
+    def test__collect_other_players(self) -> None:
+        """Test method."""
+
+    def test__has_discardable_group(self) -> None:
+        """Test method."""
+
+    def test_draw_discard_is_pending(self) -> None:
+        """Test method."""
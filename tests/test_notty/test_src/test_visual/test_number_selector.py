@@ -13,7 +13,10 @@ class TestNumberButton:
     def test_update_hover(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
+    def test__render_state(self) -> None:
         """Test method."""
 
 
@@ -1,5 +1,21 @@
 """module."""
 
+import random
+
+import pygame
+
+from notty.src.visual.card import Color, VisualCard
+from notty.src.visual.player import HAND_SLOT_OFFSETS, VisualHand, VisualPlayer
+
+
+def assert_hand_laid_out(hand: VisualHand) -> None:
+    """Assert that the hand is sorted and every card heads to its own slot."""
+    packed = [card.packed for card in hand.cards]
+    assert packed == sorted(packed)
+    targets = [(card.target_x, card.target_y) for card in hand.cards]
+    expected = [(hand.x + dx, hand.y + dy) for dx, dy in HAND_SLOT_OFFSETS]
+    assert targets == expected[: len(targets)]
+
 
 class TestVisualHand:
     """Test class."""
@@ -7,7 +23,7 @@ class TestVisualHand:
     def test___init__(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
         """Test method."""
 
     def test_get_png_name(self) -> None:
@@ -21,6 +37,33 @@ class TestVisualHand:
 
     def test_add_card(self) -> None:
         """Test method."""
+        screen = pygame.Surface((1, 1))
+        player = VisualPlayer("eren", screen=screen)
+        VisualPlayer.ACTIVE_PLAYERS.remove(player)
+        hand = player.hand
+        hand_cards = [
+            (Color.BLUE, 2),
+            (Color.RED, 1),
+            (Color.RED, 3),
+            (Color.RED, 5),
+            (Color.RED, 7),
+        ]
+        # steal every slot once, then add a card behind the gap
+        for seed in range(20):
+            hand.cards.clear()
+            hand.add_cards(
+                [
+                    VisualCard(color, number, 0, 0, screen)
+                    for color, number in hand_cards
+                ],
+            )
+            hand.rng = random.Random(seed)  # noqa: S311  # nosec: B311
+            hand.pop_random_card()
+            assert_hand_laid_out(hand)
+            hand.add_card(VisualCard(Color.YELLOW, 9, 0, 0, screen))
+            assert_hand_laid_out(hand)
+            hand.add_card(VisualCard(Color.BLACK, 4, 0, 0, screen))
+            assert_hand_laid_out(hand)
 
     def test_add_cards(self) -> None:
         """Test method."""
@@ -40,7 +83,13 @@ class TestVisualHand:
     def test_size(self) -> None:
         """Test method."""
 
-    def test_shuffle(self) -> None:
+    def test_pop_random_card(self) -> None:
+        """Test method."""
+
+    def test__append_card(self) -> None:
+        """Test method."""
+
+    def test__layout_cards(self) -> None:
         """Test method."""
 
 
@@ -50,7 +99,7 @@ class TestVisualPlayer:
     def test___init__(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
         """Test method."""
 
     def test_get_png_name(self) -> None:
@@ -64,3 +113,9 @@ class TestVisualPlayer:
 
     def test_get_all_player_names(self) -> None:
         """Test method."""
+
+    def test_get_scaled_png(self) -> None:
+        """Test method."""
+
+    def test_get_image(self) -> None:
+        """Test method."""
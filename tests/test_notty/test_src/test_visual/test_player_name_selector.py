@@ -7,7 +7,10 @@ class TestPlayerNameButton:
     def test___init__(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
+    def test_get_rect(self) -> None:
         """Test method."""
 
 
@@ -31,3 +34,9 @@ class TestPlayerNameSelector:
 
     def test_show(self) -> None:
         """Test method."""
+
+    def test__render_static_text(self) -> None:
+        """Test method."""
+
+    def test__get_present_rect(self) -> None:
+        """Test method."""
@@ -13,7 +13,10 @@ class TestPlayerButton:
     def test_update_hover(self) -> None:
         """Test method."""
 
-    def test_draw(self) -> None:
+    def test_collect_blits(self) -> None:
+        """Test method."""
+
+    def test_get_rect(self) -> None:
         """Test method."""
 
 
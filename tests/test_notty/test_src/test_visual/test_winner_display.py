@@ -4,7 +4,7 @@
 class TestWinnerDisplay:
     """Test class."""
 
-    def test__draw_button(self) -> None:
+    def test__render_button(self) -> None:
         """Test method."""
 
     def test___init__(self) -> None:
@@ -15,3 +15,18 @@ class TestWinnerDisplay:
 
     def test__draw(self) -> None:
         """Test method."""
+
+    def test__render_background(self) -> None:
+        """Test method."""
+
+    def test__get_button_at(self) -> None:
+        """Test method."""
+
+    def test__draw_buttons(self) -> None:
+        """Test method."""
+
+    def test__collect_button_blits(self) -> None:
+        """Test method."""
+
+    def test__render_dialog(self) -> None:
+        """Test method."""